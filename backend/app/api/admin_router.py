@@ -13,25 +13,27 @@ still works without extra client work.
 """
 
 import asyncio
-import json
+import time
 import uuid
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crud.election import get_election, get_active_election
-from app.core.database import check_db_health, get_db
+from app.core.database import check_db_health, get_db, get_session_factory
 from app.crud.crud_candidates import get_candidate_statistics
 from app.crud.crud_electorates import get_electorate, get_electorates
 from app.crud.crud_portfolios import get_portfolio_statistics
 from app.crud.crud_votes import get_all_election_results, get_recent_votes_engine, get_voting_statistics_engine
-from app.crud.crud_voting_tokens import get_electorates_with_tokens
+from app.crud.crud_voting_tokens import stream_electorates_with_tokens
 from app.middleware.auth_middleware import get_current_admin, get_current_user, require_permission
 from app.schemas.electorates import (
     BulkTokenGenerationRequest,
@@ -46,10 +48,29 @@ from app.services.token_generation_service import BulkTokenGenerator
 from app.utils.security_audit import SecurityAuditLogger
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/admin", tags=["Admin"])
+# ORJSONResponse serializes UUIDs/datetimes natively and skips
+# jsonable_encoder for the large statistics/results payloads.
+router = APIRouter(prefix="/admin", tags=["Admin"], default_response_class=ORJSONResponse)
 token_generator = BulkTokenGenerator()
 
 
+# ---------------------------------------------------------------------------
+# Timestamp helper
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _iso_for_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second, tz=timezone.utc).isoformat()
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO-8601 string, bucketed to whole seconds so
+    all payload timestamps within the same second share one formatting call.
+    """
+    return _iso_for_second(int(time.time()))
+
+
 # ---------------------------------------------------------------------------
 # Election resolution helper
 # ---------------------------------------------------------------------------
@@ -75,41 +96,194 @@ async def _resolve_election(db: AsyncSession, election_id: Optional[UUID]) -> UU
 
 
 # ---------------------------------------------------------------------------
-# SSE Streaming
+# Statistics aggregation
 # ---------------------------------------------------------------------------
 
-async def _results_event_generator(
-    request: Request, db: AsyncSession, election_id: UUID, interval: int
-):
-    while True:
-        if await request.is_disconnected():
-            break
-        try:
-            results = await get_all_election_results(db, election_id)
-            yield f"data: {json.dumps(results)}\n\n"
-        except Exception as exc:
-            yield f"event: error\ndata: {json.dumps({'error': str(exc)})}\n\n"
-        await asyncio.sleep(interval)
-
-
-async def _statistics_event_generator(
-    request: Request, db: AsyncSession, election_id: UUID, interval: int
+async def _gather_statistics(election_id: UUID) -> dict:
+    """
+    Run the four independent statistics aggregates concurrently.
+
+    AsyncSession is not safe for concurrent use, so each aggregate gets its
+    own session from the pool.  Wall-clock time drops from the sum of the
+    four queries to the slowest one.
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as db1, session_factory() as db2, \
+            session_factory() as db3, session_factory() as db4:
+        voting, tokens, portfolios, candidates = await asyncio.gather(
+            get_voting_statistics_engine(db1, election_id),
+            token_generator.get_token_statistics(db2, election_id),
+            get_portfolio_statistics(db3, election_id),
+            get_candidate_statistics(db4, election_id),
+        )
+    return {
+        "voting": voting,
+        "tokens": tokens,
+        "portfolios": portfolios,
+        "candidates": candidates,
+        "timestamp": _utc_now_iso(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# SSE Streaming — shared producer / fan-out
+# ---------------------------------------------------------------------------
+
+class _SSEBroadcaster:
+    """
+    Fan a periodically computed SSE payload out to many clients.
+
+    One background producer task per (election_id, interval) computes the
+    payload once per tick and pushes it to every subscriber's queue, so DB
+    load scales with ticks — O(ticks) — instead of O(clients × ticks) as it
+    did when every client polled the database independently.
+
+    Producers are started lazily on first subscribe and cancelled when the
+    last subscriber for their key disconnects.
+
+    Producers are change-driven: cast_vote calls mark_dirty() when a ballot
+    commits, and a tick recomputes only when its flag is set (or when the
+    SSE_IDLE_REFRESH_SECONDS fallback elapses — the dirty flag is
+    per-process, so ballots committed by another worker need the periodic
+    refresh).  Idle ticks send a comment-line keepalive with no DB work.
+    """
+
+    def __init__(self, compute):
+        # compute: async callable (election_id) -> str (a full SSE frame)
+        self._compute = compute
+        self._producers: dict = {}
+        self._subscribers: dict = {}
+        self._dirty: dict = {}
+
+    def subscribe(self, election_id: UUID, interval: int) -> asyncio.Queue:
+        key = (election_id, interval)
+        # maxsize=1: a slow client just skips ticks instead of buffering them
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(key, set()).add(queue)
+        if key not in self._producers:
+            event = asyncio.Event()
+            event.set()  # first tick always computes
+            self._dirty[key] = event
+            self._producers[key] = asyncio.create_task(self._produce(key))
+        return queue
+
+    def unsubscribe(self, election_id: UUID, interval: int, queue: asyncio.Queue) -> None:
+        key = (election_id, interval)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            self._subscribers.pop(key, None)
+            self._dirty.pop(key, None)
+            producer = self._producers.pop(key, None)
+            if producer:
+                producer.cancel()
+
+    def mark_dirty(self, election_id: UUID) -> None:
+        """Wake every producer for this election — its data just changed."""
+        for key, event in self._dirty.items():
+            if key[0] == election_id:
+                event.set()
+
+    async def _produce(self, key) -> None:
+        election_id, interval = key
+        loop = asyncio.get_running_loop()
+        dirty = self._dirty[key]
+        deadline = loop.time()
+        last_compute = float("-inf")
+        while True:
+            # Fixed-rate schedule on the monotonic clock: the deadline advances
+            # by exactly `interval` per tick regardless of how long the compute
+            # took, so ticks don't drift by (work time) as they did with a
+            # plain sleep(interval) after the work.
+            deadline += interval
+            if dirty.is_set() or loop.time() - last_compute >= settings.SSE_IDLE_REFRESH_SECONDS:
+                dirty.clear()
+                try:
+                    payload = await self._compute(election_id)
+                except Exception as exc:
+                    payload = f"event: error\ndata: {orjson.dumps({'error': str(exc)}).decode()}\n\n"
+                last_compute = loop.time()
+            else:
+                # Nothing changed — keepalive comment, no database work
+                payload = ": ping\n\n"
+
+            # If the compute overran one or more whole intervals, coalesce the
+            # missed ticks instead of firing back-to-back to catch up.
+            dropped = 0
+            now = loop.time()
+            while deadline <= now:
+                deadline += interval
+                dropped += 1
+            if dropped:
+                # SSE comment line — ignored by EventSource, visible in logs
+                payload += f": dropped-ticks={dropped}\n\n"
+
+            for queue in list(self._subscribers.get(key, ())):
+                if queue.full():
+                    if payload.startswith(":"):
+                        # Never evict an unread data frame for a keepalive
+                        continue
+                    # Drop the stale tick for this client — latest data wins
+                    try:
+                        queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        pass
+                queue.put_nowait(payload)
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+
+async def _compute_results_frame(election_id: UUID) -> str:
+    session_factory = get_session_factory()
+    async with session_factory() as db:
+        results = await get_all_election_results(db, election_id)
+    return f"data: {orjson.dumps(results).decode()}\n\n"
+
+
+async def _compute_statistics_frame(election_id: UUID) -> str:
+    stats = await _gather_statistics(election_id)
+    return f"data: {orjson.dumps(stats).decode()}\n\n"
+
+
+_results_broadcaster = _SSEBroadcaster(_compute_results_frame)
+_statistics_broadcaster = _SSEBroadcaster(_compute_statistics_frame)
+
+
+def notify_vote_cast(election_id: UUID) -> None:
+    """
+    Wake the SSE producers for an election — called by cast_vote after a
+    ballot commits, so streams push fresh data without waiting out a tick.
+    """
+    _results_broadcaster.mark_dirty(election_id)
+    _statistics_broadcaster.mark_dirty(election_id)
+
+
+async def _subscriber_event_generator(
+    broadcaster: _SSEBroadcaster, request: Request, election_id: UUID, interval: int
 ):
-    while True:
-        if await request.is_disconnected():
-            break
-        try:
-            stats = {
-                "voting": await get_voting_statistics_engine(db, election_id),
-                "tokens": await token_generator.get_token_statistics(db, election_id),
-                "portfolios": await get_portfolio_statistics(db, election_id),
-                "candidates": await get_candidate_statistics(db, election_id),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            yield f"data: {json.dumps(stats)}\n\n"
-        except Exception as exc:
-            yield f"event: error\ndata: {json.dumps({'error': str(exc)})}\n\n"
-        await asyncio.sleep(interval)
+    """Yield frames from a broadcaster until the client disconnects."""
+    queue = broadcaster.subscribe(election_id, interval)
+    try:
+        while True:
+            if await request.is_disconnected():
+                break
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=interval)
+            except asyncio.TimeoutError:
+                # No frame this tick — loop back and re-check the connection
+                continue
+            yield payload
+    finally:
+        broadcaster.unsubscribe(election_id, interval, queue)
+
+
+def _results_event_generator(request: Request, election_id: UUID, interval: int):
+    return _subscriber_event_generator(_results_broadcaster, request, election_id, interval)
+
+
+def _statistics_event_generator(request: Request, election_id: UUID, interval: int):
+    return _subscriber_event_generator(_statistics_broadcaster, request, election_id, interval)
 
 
 _SSE_HEADERS = {
@@ -131,7 +305,7 @@ async def stream_election_results(
     eid = await _resolve_election(db, election_id)
     safe_interval = settings.clamp_sse_interval(interval)
     return StreamingResponse(
-        _results_event_generator(request, db, eid, safe_interval),
+        _results_event_generator(request, eid, safe_interval),
         media_type="text/event-stream",
         headers=_SSE_HEADERS,
     )
@@ -149,7 +323,7 @@ async def stream_election_statistics(
     eid = await _resolve_election(db, election_id)
     safe_interval = settings.clamp_sse_interval(interval)
     return StreamingResponse(
-        _statistics_event_generator(request, db, eid, safe_interval),
+        _statistics_event_generator(request, eid, safe_interval),
         media_type="text/event-stream",
         headers=_SSE_HEADERS,
     )
@@ -246,14 +420,26 @@ async def list_voters(
     limit: int = 100,
     has_voted: Optional[bool] = None,
     election_id: Optional[UUID] = None,
+    after_name: Optional[str] = None,
+    after_id: Optional[UUID] = None,
     db: AsyncSession = Depends(get_db),
     current_admin=Depends(require_permission("view_voters")),
 ):
-    """List voters, optionally scoped to an election's voter roll."""
-    voters = await get_electorates(db, skip=skip, limit=limit, election_id=election_id)
-    if has_voted is not None:
-        voters = [v for v in voters if v.get("has_voted") == has_voted]
-    return voters
+    """
+    List voters, optionally scoped to an election's voter roll.
+
+    For deep pagination pass the previous page's last name/id as
+    after_name/after_id (keyset — O(limit) per page) instead of skip.
+    """
+    return await get_electorates(
+        db,
+        skip=skip,
+        limit=limit,
+        election_id=election_id,
+        has_voted=has_voted,
+        after_name=after_name,
+        after_id=after_id,
+    )
 
 
 @router.get("/voters/{voter_id}", response_model=ElectorateOut)
@@ -278,9 +464,22 @@ async def get_electorate_tokens_endpoint(
     Return voters with their active tokens for the admin display window.
     Tokens are served from the in-process plaintext cache populated at
     generation time.  token=None means the cache has expired — regenerate.
+
+    Streamed as a JSON array straight off a server-side cursor, so a
+    50k-voter roll never sits fully in memory and the first bytes go out
+    while later rows are still being fetched.
     """
     eid = await _resolve_election(db, election_id)
-    return await get_electorates_with_tokens(db, eid)
+
+    async def generate():
+        yield b"["
+        first = True
+        async for item in stream_electorates_with_tokens(db, eid):
+            yield (b"" if first else b",") + orjson.dumps(item)
+            first = False
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -294,13 +493,7 @@ async def get_election_statistics(
     current_user=Depends(get_current_user),
 ):
     eid = await _resolve_election(db, election_id)
-    return {
-        "voting": await get_voting_statistics_engine(db, eid),
-        "tokens": await token_generator.get_token_statistics(db, eid),
-        "portfolios": await get_portfolio_statistics(db, eid),
-        "candidates": await get_candidate_statistics(db, eid),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    return await _gather_statistics(eid)
 
 
 @router.get("/results", response_model=List[ElectionResults])
@@ -325,7 +518,7 @@ async def get_recent_activity(
     return {
         "recent_votes": recent_votes,
         "total_recent_votes": len(recent_votes),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_now_iso(),
     }
 
 
@@ -352,7 +545,7 @@ async def health_check():
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database unavailable",
         )
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+    return {"status": "healthy", "timestamp": _utc_now_iso()}
 
 
 __all__ = ["router"]
\ No newline at end of file
@@ -8,36 +8,53 @@ here so no query params are needed and clients cannot spoof a different election
 VOTE SUBMISSION TRANSACTION (cast_vote)
 ───────────────────────────────────────
 One atomic commit that:
-  1. Validates every vote (VotingSecurityValidator)
-  2. Inserts all Vote rows (db.flush → UniqueConstraint fires per vote)
+  1. Validates every vote (VotingSecurityValidator, against a prefetched
+     ballot context — no per-vote queries)
+  2. Inserts all validated Vote rows with one multi-row INSERT
   3. Marks VotingToken as used (token.mark_voted())
   4. Updates Electorate.has_voted + ElectionVoterRoll.has_voted atomically
   5. Terminates the VotingSession
   6. Commits once — full rollback on failure
 
-An IntegrityError on a single vote rolls back only that vote;
-remaining votes in the ballot are still attempted.
+If the batch INSERT hits a UniqueConstraint (concurrent duplicate), the
+rows are retried one by one so the non-conflicting votes still land.
 A SQLAlchemyError on the final commit aborts everything.
 """
 
 import logging
+
+import orjson
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import select, text
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, text, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.admin_router import notify_vote_cast
 from app.core.database import get_db
 from app.crud.election import get_election
 from app.crud.crud_electorates import mark_electorate_voted
 from app.crud.crud_portfolios import get_active_portfolios_for_voting
-from app.crud.crud_votes import create_vote, get_votes_by_electorate
+from app.crud.crud_votes import (
+    create_votes_bulk,
+    get_all_election_results,
+    get_votes_by_electorate,
+    get_voting_statistics_engine,
+)
 from app.crud.crud_voting_tokens import get_voting_token_by_id
-from app.middleware.auth_middleware import get_current_voter, rate_limit_voting
+from app.middleware.auth_middleware import (
+    VoterRecord,
+    evict_cached_voter,
+    evict_session_state,
+    get_current_voter,
+    rate_limit_voting,
+)
 from app.middleware.voting_middleware import VotingSecurityValidator
-from app.models.electorates import Electorate, VotingSession
+from app.models.electorates import VotingSession
 from app.schemas.electorates import (
     CandidateOut,
     VoteOut,
@@ -45,11 +62,15 @@ from app.schemas.electorates import (
     VotingSessionResponse,
     StudentIDConverter,
 )
-from app.utils.security import TokenManager
+from app.utils.ballot_cache import ballot_etag, get_cached_ballot, store_cached_ballot
+from app.utils.jwt_cache import try_decode_token
 from app.utils.security_audit import SecurityAuditLogger
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/voting", tags=["Voting"])
+# Same rationale as the admin router: orjson's C encoder renders the
+# ballot (all portfolios + candidates) and vote summaries several times
+# faster than stdlib json, which matters at ballot-load spikes.
+router = APIRouter(prefix="/voting", tags=["Voting"], default_response_class=ORJSONResponse)
 
 
 # ---------------------------------------------------------------------------
@@ -60,10 +81,7 @@ def _jwt_payload(request: Request) -> dict:
     auth = request.headers.get("authorization", "")
     if not auth.startswith("Bearer "):
         return {}
-    try:
-        return TokenManager.decode_token(auth.split(" ", 1)[1])
-    except Exception:
-        return {}
+    return try_decode_token(auth.split(" ", 1)[1]) or {}
 
 
 def _election_id(payload: dict) -> Optional[UUID]:
@@ -106,9 +124,20 @@ def _client_ip(request: Request) -> str:
 async def get_voting_ballot(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    electorate: Electorate = Depends(get_current_voter),
+    electorate: VoterRecord = Depends(get_current_voter),
 ):
-    """Return the full ballot for the active election."""
+    """
+    Return the full ballot for the active election.
+
+    Supports ETag / If-None-Match: the ballot is stable during a vote
+    window, so repeat polls from the same client get an empty 304 without
+    touching the DB or serializing anything.  The tag is bumped by every
+    portfolio/candidate write (see app.utils.ballot_cache).
+
+    Cache misses serialize the ballot to JSON bytes once and reuse them
+    for every voter until the ETag rolls over — the join runs once per
+    window, not once per request.
+    """
     if electorate.has_voted:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -122,20 +151,41 @@ async def get_voting_ballot(
 
     payload = _jwt_payload(request)
     election_id = _require_election_id(payload)
-    return await get_active_portfolios_for_voting(db, election_id)
+
+    etag = ballot_etag(election_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    body = get_cached_ballot(etag)
+    if body is None:
+        candidates = await get_active_portfolios_for_voting(db, election_id)
+        # Trusted rows straight from the DB — skip per-row validation
+        body = orjson.dumps(
+            [CandidateOut.from_orm_fast(c).model_dump() for c in candidates]
+        )
+        store_cached_ballot(etag, body)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, max-age=30"},
+    )
 
 
 # ---------------------------------------------------------------------------
 # POST /vote
 # ---------------------------------------------------------------------------
 
-@router.post("/vote", response_model=VotingSessionResponse)
+# VotingSessionResponse is kept for OpenAPI docs only — the handler builds
+# the four fields itself, so the outbound Pydantic validation pass is
+# skipped and the dict renders straight through orjson.
+@router.post("/vote", responses={200: {"model": VotingSessionResponse}})
 @rate_limit_voting
 async def cast_vote(
     vote_data: VotingCreation,
     request: Request,
     db: AsyncSession = Depends(get_db),
-    electorate: Electorate = Depends(get_current_voter),
+    electorate: VoterRecord = Depends(get_current_voter),
 ):
     """
     Submit the full ballot.
@@ -185,41 +235,32 @@ async def cast_vote(
     votes = []
     failed_votes = []
 
+    # One batched round of lookups for the whole ballot — the per-vote
+    # validation below is then pure dict/set checks, no awaits.
+    ballot_context = await VotingSecurityValidator.prefetch_ballot_context(
+        db,
+        election_id,
+        electorate.id,
+        [v.portfolio_id for v in vote_data.votes],
+        [v.candidate_id for v in vote_data.votes],
+    )
+
+    # ── Validate every vote first (pure Python — no DB access) ────────────
+    validated = []
     for vote_request in vote_data.votes:
-        # Each vote is wrapped in a savepoint so an IntegrityError on one vote
-        # rolls back only that vote without invalidating the outer transaction.
-        savepoint = await db.begin_nested()
         try:
             # Full validation — election open, token valid, voter enrolled,
             # portfolio/candidate checks, double-vote check
             await VotingSecurityValidator.validate_vote_request(
-                db=db,
                 voting_token=voting_token,
                 election_id=election_id,
                 electorate_id=electorate.id,
                 portfolio_id=vote_request.portfolio_id,
                 candidate_id=vote_request.candidate_id,
                 election=election,
+                context=ballot_context,
             )
-
-            vote = await create_vote(
-                db=db,
-                vote_data=vote_request,
-                voting_token_id=tok_id,
-                election_id=election_id,
-                voting_session_id=sess_id,
-                ip_address=client_ip,
-                user_agent=user_agent,
-            )
-            await savepoint.commit()
-            votes.append(vote)
-
-            await SecurityAuditLogger.log_vote_cast(
-                db, str(electorate.id), str(vote_request.portfolio_id), success=True
-            )
-
         except HTTPException as exc:
-            await savepoint.rollback()
             failed_votes.append({
                 "portfolio_id": str(vote_request.portfolio_id),
                 "candidate_id": str(vote_request.candidate_id),
@@ -230,30 +271,77 @@ async def cast_vote(
                 success=False,
                 reason=exc.detail if isinstance(exc.detail, str) else "validation_failed",
             )
+            continue
+
+        # Guard against duplicate portfolios later in this same ballot
+        ballot_context["voted_portfolio_ids"].add(vote_request.portfolio_id)
+        validated.append(vote_request)
+
+    # ── Insert the whole ballot with one multi-row INSERT ─────────────────
+    # The savepoint keeps an IntegrityError (concurrent duplicate) from
+    # invalidating the outer transaction; on conflict, fall back to per-row
+    # inserts to salvage the non-conflicting votes.
+    voted_at = datetime.now(timezone.utc)
+    vote_rows = [
+        {
+            "election_id": election_id,
+            "portfolio_id": v.portfolio_id,
+            "candidate_id": v.candidate_id,
+            "voting_token_id": tok_id,
+            "voting_session_id": sess_id,
+            "vote_type": v.vote_type,
+            "ip_address": client_ip,
+            "user_agent": user_agent,
+            "voted_at": voted_at,
+        }
+        for v in validated
+    ]
 
+    async def _insert_rows(rows) -> bool:
+        savepoint = await db.begin_nested()
+        try:
+            await create_votes_bulk(db, rows)
+            await savepoint.commit()
+            return True
         except IntegrityError:
             await savepoint.rollback()
-            failed_votes.append({
-                "portfolio_id": str(vote_request.portfolio_id),
-                "candidate_id": str(vote_request.candidate_id),
-                "error": "Already voted for this portfolio (concurrent duplicate)",
-            })
-            await SecurityAuditLogger.log_vote_cast(
-                db, str(electorate.id), str(vote_request.portfolio_id),
-                success=False, reason="db_constraint_duplicate",
-            )
-
+            return False
         except SQLAlchemyError as exc:
             await savepoint.rollback()
             logger.error(
-                "DB error — electorate %s portfolio %s: %s",
-                electorate.id, vote_request.portfolio_id, exc,
+                "DB error — electorate %s ballot of %d vote(s): %s",
+                electorate.id, len(rows), exc,
             )
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Database error while recording vote. Please retry.",
             )
 
+    if vote_rows and await _insert_rows(vote_rows):
+        votes = validated
+        for v in validated:
+            await SecurityAuditLogger.log_vote_cast(
+                db, str(electorate.id), str(v.portfolio_id), success=True
+            )
+    else:
+        # Rare path: a concurrent duplicate failed the batch — retry per row
+        for v, row in zip(validated, vote_rows):
+            if await _insert_rows([row]):
+                votes.append(v)
+                await SecurityAuditLogger.log_vote_cast(
+                    db, str(electorate.id), str(v.portfolio_id), success=True
+                )
+            else:
+                failed_votes.append({
+                    "portfolio_id": str(v.portfolio_id),
+                    "candidate_id": str(v.candidate_id),
+                    "error": "Already voted for this portfolio (concurrent duplicate)",
+                })
+                await SecurityAuditLogger.log_vote_cast(
+                    db, str(electorate.id), str(v.portfolio_id),
+                    success=False, reason="db_constraint_duplicate",
+                )
+
     # ── Atomically finalize if any votes succeeded ────────────────────────
     if votes:
         # 1. Mark token consumed (is_used=True, is_active=False)
@@ -262,14 +350,20 @@ async def cast_vote(
         # 2. Update Electorate.has_voted + ElectionVoterRoll.has_voted in one call
         await mark_electorate_voted(db, electorate.id, election_id)
 
-        # 3. Terminate the voting session
+        # 3. Terminate the voting session — direct UPDATE (mirrors
+        #    VotingSession.mark_submitted) instead of SELECT-then-mutate,
+        #    so it rides the same flush as the vote rows
         if sess_id:
-            session_result = await db.execute(
-                select(VotingSession).where(VotingSession.id == sess_id)
+            await db.execute(
+                update(VotingSession)
+                .where(VotingSession.id == sess_id)
+                .values(
+                    vote_submitted=True,
+                    is_valid=False,
+                    terminated_at=voted_at,
+                    termination_reason="vote_submitted",
+                )
             )
-            session = session_result.scalar_one_or_none()
-            if session:
-                session.mark_submitted()
 
     try:
         await db.commit()
@@ -281,6 +375,17 @@ async def cast_vote(
             detail="Failed to save votes. Please retry.",
         )
 
+    # Results change only when a ballot lands — drop the cached aggregates so
+    # the next SSE tick / REST poll sees this ballot instead of waiting out
+    # the TTL window, and wake the SSE producers for this election.
+    if votes:
+        get_all_election_results.cache_clear()
+        get_voting_statistics_engine.cache_clear()
+        notify_vote_cast(election_id)
+        evict_cached_voter(electorate.id)
+        if sess_id:
+            evict_session_state(sess_id)
+
     # ── Response ──────────────────────────────────────────────────────────
     success = len(votes) > 0
     if success and not failed_votes:
@@ -290,12 +395,12 @@ async def cast_vote(
     else:
         message = "No votes were cast"
 
-    return VotingSessionResponse(
-        success=success,
-        message=message,
-        votes_cast=len(votes),
-        failed_votes=failed_votes,
-    )
+    return {
+        "success": success,
+        "message": message,
+        "votes_cast": len(votes),
+        "failed_votes": failed_votes,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -306,7 +411,7 @@ async def cast_vote(
 async def get_my_votes(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    electorate: Electorate = Depends(get_current_voter),
+    electorate: VoterRecord = Depends(get_current_voter),
 ):
     """
     Return a summary of the votes cast by the current voter in this election.
@@ -338,7 +443,7 @@ async def get_my_votes(
 async def get_voting_status(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    electorate: Electorate = Depends(get_current_voter),
+    electorate: VoterRecord = Depends(get_current_voter),
 ):
     """Return the current voter's voting status for this election."""
     payload = _jwt_payload(request)
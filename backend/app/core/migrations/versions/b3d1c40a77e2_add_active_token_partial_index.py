@@ -0,0 +1,29 @@
+"""add partial index for active-token lookups
+
+Revision ID: b3d1c40a77e2
+Revises: 45f644efdf55
+Create Date: 2026-08-29 10:12:41.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d1c40a77e2'
+down_revision = '45f644efdf55'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_voting_tokens_active",
+        "voting_tokens",
+        ["electorate_id", "expires_at"],
+        postgresql_where=sa.text("revoked = false AND is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_voting_tokens_active", table_name="voting_tokens")
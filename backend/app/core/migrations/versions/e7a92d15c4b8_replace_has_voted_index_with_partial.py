@@ -0,0 +1,31 @@
+"""replace has_voted boolean index with a pending-voters partial index
+
+Revision ID: e7a92d15c4b8
+Revises: b3d1c40a77e2
+Create Date: 2026-08-29 10:31:07.114562
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a92d15c4b8'
+down_revision = 'b3d1c40a77e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_students_has_voted", table_name="students")
+    op.create_index(
+        "ix_students_pending",
+        "students",
+        ["student_id"],
+        postgresql_where=sa.text("has_voted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_students_pending", table_name="students")
+    op.create_index("ix_students_has_voted", "students", ["has_voted"])
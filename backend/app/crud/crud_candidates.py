@@ -14,8 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.models.electorates import Candidate, Portfolio, Vote
 from app.schemas.electorates import CandidateCreate, CandidateUpdate
+from app.utils.ballot_cache import bump_ballot_version
+from app.utils.cache import async_cached
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +39,7 @@ async def create_candidate_engine(
     db.add(candidate)
     await db.commit()
     await db.refresh(candidate)
+    bump_ballot_version()
 
     result = await db.execute(
         select(Candidate)
@@ -75,6 +79,30 @@ async def get_candidate_engine(
     return result.scalar_one_or_none()
 
 
+async def get_candidates_by_ids(
+    db: AsyncSession,
+    candidate_ids: List[UUID],
+    election_id: UUID,
+) -> Dict[UUID, Candidate]:
+    """
+    Batch variant of get_candidate_engine for ballot validation — one query
+    for every candidate referenced by a ballot instead of one per vote.
+    Election scoping joins through Portfolio, like the single-row variant;
+    missing/foreign-election IDs are simply absent from the returned dict.
+    """
+    if not candidate_ids:
+        return {}
+    result = await db.execute(
+        select(Candidate)
+        .join(Portfolio, Candidate.portfolio_id == Portfolio.id)
+        .where(
+            Candidate.id.in_(candidate_ids),
+            Portfolio.election_id == election_id,
+        )
+    )
+    return {c.id: c for c in result.scalars().all()}
+
+
 async def get_candidates_by_portfolio(
     db: AsyncSession,
     portfolio_id: UUID,
@@ -211,6 +239,7 @@ async def update_candidate_engine(
     candidate.updated_at = datetime.now(timezone.utc)
     await db.commit()
     await db.refresh(candidate)
+    bump_ballot_version()
     return candidate
 
 
@@ -242,6 +271,7 @@ async def delete_candidate_engine(
 
     await db.delete(candidate)
     await db.commit()
+    bump_ballot_version()
     return True
 
 
@@ -249,11 +279,15 @@ async def delete_candidate_engine(
 # Statistics
 # ---------------------------------------------------------------------------
 
+@async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
 async def get_candidate_statistics(
     db: AsyncSession,
     election_id: UUID,
 ) -> Dict[str, Any]:
-    """Aggregate candidate stats for a specific election."""
+    """
+    Aggregate candidate stats for a specific election.
+    Cached for STATS_CACHE_TTL_SECONDS — polled every tick by the SSE stream.
+    """
     total = (
         await db.execute(
             select(func.count(Candidate.id))
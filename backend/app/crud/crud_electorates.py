@@ -25,12 +25,12 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import BackgroundTasks
 from app.services.enroll_voters import update_voter_roll_background
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, sessionmaker
 
-from app.models.electorates import Electorate, ElectionVoterRoll
+from app.models.electorates import Electorate, ElectionVoterRoll, VotingToken
 from app.schemas.electorates import ElectorateCreate, ElectorateUpdate, StudentIDConverter
 
 logger = logging.getLogger(__name__)
@@ -87,19 +87,54 @@ async def get_electorates(
     skip: int = 0,
     limit: int = 100,
     election_id: Optional[UUID] = None,
+    has_voted: Optional[bool] = None,
+    after_name: Optional[str] = None,
+    after_id: Optional[UUID] = None,
 ) -> List[dict]:
     """
     Return a page of voter records as plain dicts (ready for JSON response).
 
     If election_id is provided, only voters enrolled in that election are
-    returned.  student_id is converted to display format (slashes).
+    returned.  If has_voted is provided, the filter is applied in SQL so
+    pagination stays correct (post-filtering a page in Python returned
+    short/empty pages).  student_id is converted to display format (slashes).
+
+    PAGINATION
+    ──────────
+    Pass the previous page's last (name, id) as after_name/after_id for
+    keyset pagination: each page is O(limit) no matter how deep, where
+    OFFSET makes Postgres scan and discard `skip` rows first.  The cursor
+    values come straight from the previous page's payload (use "" for a
+    null name).  `skip` still works for old callers but degrades on deep
+    pages.
     """
+    # name is nullable — coalesce to "" so the keyset tuple is total-ordered
+    name_key = func.coalesce(Electorate.name, "")
+
+    # Token status is computed in SQL as a correlated EXISTS instead of
+    # selectin-loading every voter's token history and filtering it in
+    # Python — the predicate matches ix_voting_tokens_active.
+    token_filters = [
+        VotingToken.electorate_id == Electorate.id,
+        VotingToken.revoked == False,
+        VotingToken.is_active == True,
+        VotingToken.is_used == False,
+        VotingToken.expires_at > func.now(),
+    ]
+    if election_id is not None:
+        token_filters.append(VotingToken.election_id == election_id)
+    has_active_token = (
+        select(VotingToken.id).where(and_(*token_filters)).exists()
+    )
+
     query = (
-        select(Electorate)
-        .options(selectinload(Electorate.voting_tokens))
+        select(Electorate, has_active_token.label("has_active_token"))
         .where(Electorate.is_deleted == False)
     )
 
+    if has_voted is not None:
+        query = query.where(Electorate.has_voted == has_voted)
+
     if election_id is not None:
         query = query.join(
             ElectionVoterRoll,
@@ -109,26 +144,19 @@ async def get_electorates(
             ),
         )
 
-    query = query.order_by(Electorate.name).offset(skip).limit(limit)
-    electorates = (await db.execute(query)).scalars().all()
+    if after_id is not None:
+        query = query.where(
+            tuple_(name_key, Electorate.id) > (after_name or "", after_id)
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    query = query.order_by(name_key, Electorate.id).limit(limit)
+    rows = (await db.execute(query)).all()
 
-    now = datetime.now(timezone.utc)
     response = []
 
-    for e in electorates:
-        has_active_token = False
-        for token in (e.voting_tokens or []):
-            if token.revoked or not token.is_active or token.is_used:
-                continue
-            if election_id and token.election_id != election_id:
-                continue
-            expires_at = token.expires_at
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
-            if expires_at > now:
-                has_active_token = True
-                break
-
+    for e, token_active in rows:
         response.append({
             "id": str(e.id),
             "student_id": StudentIDConverter.to_display(e.student_id),
@@ -141,7 +169,7 @@ async def get_electorates(
             "voted_at": e.voted_at.isoformat() if e.voted_at else None,  # real column
             "created_at": e.created_at.isoformat(),
             "updated_at": e.updated_at.isoformat(),
-            "voting_token": "GENERATED" if has_active_token else None,
+            "voting_token": "GENERATED" if token_active else None,
         })
 
     return response
@@ -337,30 +365,30 @@ async def mark_electorate_voted(
 
     This MUST be called in the same transaction as:
       - VotingToken.mark_voted()
-      - create_vote() calls for each portfolio
+      - the bulk vote INSERT
 
     Do NOT commit here — the calling route handler owns the transaction.
+    Issued as two direct UPDATE statements (no SELECT-then-mutate), so the
+    flags travel in the same flush/commit as the vote rows with no extra
+    read round-trips.  The caller's in-memory Electorate object is NOT
+    refreshed — nothing reads it after submission.
     """
-    # Update global flag
-    result = await db.execute(
-        select(Electorate).where(Electorate.id == electorate_id)
+    now = datetime.now(timezone.utc)
+    await db.execute(
+        update(Electorate)
+        .where(Electorate.id == electorate_id)
+        .values(has_voted=True, voted_at=now)
     )
-    electorate = result.scalar_one_or_none()
-    if electorate:
-        electorate.mark_voted()
-
-    # Update per-election roll
-    roll_result = await db.execute(
-        select(ElectionVoterRoll).where(
+    await db.execute(
+        update(ElectionVoterRoll)
+        .where(
             and_(
                 ElectionVoterRoll.electorate_id == electorate_id,
                 ElectionVoterRoll.election_id == election_id,
             )
         )
+        .values(has_voted=True, voted_at=now)
     )
-    enrollment = roll_result.scalar_one_or_none()
-    if enrollment:
-        enrollment.mark_voted()
 
 
 # ---------------------------------------------------------------------------
@@ -15,8 +15,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.models.electorates import Candidate, Portfolio, Vote
 from app.schemas.electorates import PortfolioCreate, PortfolioUpdate
+from app.utils.ballot_cache import bump_ballot_version
+from app.utils.cache import async_cached
 
 
 # ---------------------------------------------------------------------------
@@ -32,6 +35,7 @@ async def create_portfolio_engine(
     db.add(portfolio)
     await db.commit()
     await db.refresh(portfolio)
+    bump_ballot_version()
     return portfolio
 
 
@@ -62,6 +66,27 @@ async def get_portfolio_engine(
     return result.scalar_one_or_none()
 
 
+async def get_portfolios_by_ids(
+    db: AsyncSession,
+    portfolio_ids: List[UUID],
+    election_id: UUID,
+) -> Dict[UUID, Portfolio]:
+    """
+    Batch variant of get_portfolio_engine for ballot validation — one query
+    for every portfolio referenced by a ballot instead of one per vote.
+    Missing/foreign-election IDs are simply absent from the returned dict.
+    """
+    if not portfolio_ids:
+        return {}
+    result = await db.execute(
+        select(Portfolio).where(
+            Portfolio.id.in_(portfolio_ids),
+            Portfolio.election_id == election_id,
+        )
+    )
+    return {p.id: p for p in result.scalars().all()}
+
+
 async def get_portfolio_by_name(
     db: AsyncSession,
     name: str,
@@ -203,6 +228,7 @@ async def update_portfolio_engine(
     portfolio.updated_at = datetime.now(timezone.utc)
     await db.commit()
     await db.refresh(portfolio)
+    bump_ballot_version()
     return portfolio
 
 
@@ -232,6 +258,7 @@ async def delete_portfolio_engine(
 
     await db.delete(portfolio)
     await db.commit()
+    bump_ballot_version()
     return True
 
 
@@ -239,11 +266,15 @@ async def delete_portfolio_engine(
 # Statistics
 # ---------------------------------------------------------------------------
 
+@async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
 async def get_portfolio_statistics(
     db: AsyncSession,
     election_id: UUID,
 ) -> Dict[str, Any]:
-    """Aggregate portfolio stats for a specific election."""
+    """
+    Aggregate portfolio stats for a specific election.
+    Cached for STATS_CACHE_TTL_SECONDS — polled every tick by the SSE stream.
+    """
     total = (
         await db.execute(
             select(func.count(Portfolio.id)).where(
@@ -26,13 +26,15 @@ that data from different elections is never mixed.
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import func, and_, desc, case
+from sqlalchemy import func, and_, desc, case, insert
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
 
+from app.core.config import settings
 from app.models.electorates import Vote, Candidate, Portfolio, VotingToken
 from app.schemas.electorates import VoteCreate
+from app.utils.cache import async_cached
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +78,31 @@ async def create_vote(
     return vote
 
 
+async def create_votes_bulk(
+    db: AsyncSession,
+    vote_rows: List[Dict[str, Any]],
+) -> int:
+    """
+    Insert a whole ballot's validated votes with ONE multi-row INSERT.
+
+    Each row dict must carry election_id, portfolio_id, candidate_id,
+    voting_token_id, voting_session_id, vote_type, ip_address, user_agent,
+    and voted_at; column defaults fill id and is_valid.
+
+    Does NOT commit — same contract as create_vote.
+
+    Raises:
+        IntegrityError: if ANY row violates
+            UniqueConstraint(voting_token_id, portfolio_id); the whole
+            statement fails, so the caller should fall back to per-row
+            inserts to salvage the rest of the ballot.
+    """
+    if not vote_rows:
+        return 0
+    await db.execute(insert(Vote), vote_rows)
+    return len(vote_rows)
+
+
 # ---------------------------------------------------------------------------
 # Read — single vote
 # ---------------------------------------------------------------------------
@@ -188,6 +215,35 @@ async def check_token_used_for_portfolio(
     return result.scalar_one_or_none() is not None
 
 
+async def get_voted_portfolio_ids(
+    db: AsyncSession,
+    electorate_id: UUID,
+    portfolio_ids: List[UUID],
+    election_id: UUID,
+) -> set:
+    """
+    Batched form of check_electorate_voted_for_portfolio for a whole ballot:
+    one query returns the subset of portfolio_ids this electorate has
+    already voted for.  Joins through VotingToken because Vote has no
+    electorate_id.
+    """
+    if not portfolio_ids:
+        return set()
+    result = await db.execute(
+        select(Vote.portfolio_id)
+        .join(VotingToken, Vote.voting_token_id == VotingToken.id)
+        .where(
+            and_(
+                VotingToken.electorate_id == electorate_id,
+                Vote.portfolio_id.in_(portfolio_ids),
+                Vote.election_id == election_id,
+                Vote.is_valid == True,
+            )
+        )
+    )
+    return {row[0] for row in result.all()}
+
+
 async def check_electorate_voted_for_portfolio(
     db: AsyncSession,
     electorate_id: UUID,
@@ -253,6 +309,7 @@ async def get_vote_count_by_portfolio(
 # Election results — single aggregated query, no N+1
 # ---------------------------------------------------------------------------
 
+@async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
 async def get_all_election_results(
     db: AsyncSession,
     election_id: UUID,
@@ -260,6 +317,9 @@ async def get_all_election_results(
     """
     Return results for ALL active portfolios in a given election in one query.
 
+    Cached for STATS_CACHE_TTL_SECONDS with single-flight, so all concurrent
+    SSE streams and REST polls within one window share a single computation.
+
     Uses a single LEFT OUTER JOIN + GROUP BY so the database does all
     aggregation.  No Python-side N+1.
 
@@ -274,6 +334,10 @@ async def get_all_election_results(
     rows = (
         await db.execute(
             select(
+                # IDs are stringified in Python below — cast(..., String)
+                # renders dashless hex on SQLite but dashed text on
+                # Postgres, so the SQL cast gave clients dialect-dependent
+                # id formats under the .env.testing config.
                 Portfolio.id.label("portfolio_id"),
                 Portfolio.name.label("portfolio_name"),
                 Portfolio.voting_order,
@@ -316,7 +380,7 @@ async def get_all_election_results(
 
     portfolio_map: Dict[str, Dict] = {}
     for row in rows:
-        pid = str(row.portfolio_id)
+        pid = str(row.portfolio_id)   # canonical dashed form on every dialect
         endorsed = int(row.endorsed or 0)
         abstained = int(row.abstained or 0)
 
@@ -436,6 +500,7 @@ async def get_single_portfolio_results(
 # Statistics
 # ---------------------------------------------------------------------------
 
+@async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
 async def get_voting_statistics_engine(
     db: AsyncSession,
     election_id: UUID,
@@ -443,6 +508,9 @@ async def get_voting_statistics_engine(
     """
     Overall voting statistics for a specific election.
 
+    Cached for STATS_CACHE_TTL_SECONDS (see app.utils.cache) — the SSE
+    statistics stream re-requests this every tick for every connected admin.
+
     voted_electorates is derived from Electorate.has_voted (stored column)
     joined with ElectionVoterRoll to scope to this election's voter roll.
     This avoids any reference to the non-existent Vote.electorate_id.
@@ -539,20 +607,43 @@ async def get_recent_votes_engine(
     election_id: UUID,
     limit: int = 50,
     valid_only: bool = True,
-) -> List[Vote]:
+) -> List[Dict[str, Any]]:
     """
     Most recent votes for an election — for the admin live feed.
     Returns terminal/station info (ip_address, user_agent) but NOT voter identity.
+
+    Selects plain columns in one joined query instead of hydrating Vote ORM
+    objects (which also cost two extra selectinload queries for the
+    portfolio/candidate names).  The dicts go straight to orjson.
     """
     query = (
-        select(Vote)
-        .options(
-            selectinload(Vote.portfolio),
-            selectinload(Vote.candidate),
+        select(
+            # Stringified in Python below — see get_all_election_results
+            # for why cast(..., String) is avoided on UUID columns
+            Vote.id,
+            Vote.portfolio_id,
+            Portfolio.name.label("portfolio_name"),
+            Vote.candidate_id,
+            Candidate.name.label("candidate_name"),
+            Vote.vote_type,
+            Vote.is_valid,
+            Vote.voted_at,
+            Vote.ip_address,
+            Vote.user_agent,
         )
+        .join(Portfolio, Vote.portfolio_id == Portfolio.id)
+        .outerjoin(Candidate, Vote.candidate_id == Candidate.id)
         .where(Vote.election_id == election_id)
     )
     if valid_only:
         query = query.where(Vote.is_valid == True)
     query = query.order_by(desc(Vote.voted_at)).limit(limit)
-    return (await db.execute(query)).scalars().all()
\ No newline at end of file
+    return [
+        {
+            **row,
+            "id": str(row["id"]),
+            "portfolio_id": str(row["portfolio_id"]),
+            "candidate_id": str(row["candidate_id"]) if row["candidate_id"] else None,
+        }
+        for row in (await db.execute(query)).mappings().all()
+    ]
\ No newline at end of file
@@ -8,7 +8,7 @@ Includes:
 
 PLAINTEXT TOKEN CACHE
 ─────────────────────
-The DB only ever stores the SHA-256 hash of a token.  During a generation
+The DB only ever stores the BLAKE2b-256 hash of a token.  During a generation
 run the plaintext is written to _token_display_cache keyed by electorate_id.
 Entries expire after TOKEN_DISPLAY_TTL_SECONDS (1 hour).  This window gives
 EC officials enough time to read out tokens to voters before the cache clears.
@@ -76,10 +76,27 @@ def _evict_all_plaintext_tokens() -> None:
 # Hash helper (kept here so callers don't depend on the service layer)
 # ---------------------------------------------------------------------------
 
+# BLAKE2b-256 is ~2x SHA-256 in software for short inputs, and its 64-char
+# hex digest is a drop-in fit for the token_hash column.  Tokens are opaque
+# random values (not passwords), so a fast generic hash is the right tool.
+# Module-level binding skips the hashlib attribute lookup per call; the
+# one-shot constructor-with-data form stays on the C fast path instead of a
+# copy()/update()/hexdigest() chain of Python-level calls.
+_blake2b = hashlib.blake2b
+
+# Same one-pass normalisation table as the auth router: uppercase and strip
+# dashes/spaces in a single translate call.
+_TOKEN_TRANSLATE = str.maketrans(
+    "abcdefghijklmnopqrstuvwxyz",
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "- ",
+)
+
+
 def _hash_token(plaintext: str) -> str:
-    """Normalise and SHA-256 hash a plaintext token for storage."""
-    clean = plaintext.replace("-", "").replace(" ", "").upper()
-    return hashlib.sha256(clean.encode()).hexdigest()
+    """Normalise and BLAKE2b-256 hash a plaintext token for storage."""
+    clean = plaintext.translate(_TOKEN_TRANSLATE)
+    return _blake2b(clean.encode(), digest_size=32).digest().hex()
 
 
 # ---------------------------------------------------------------------------
@@ -125,7 +142,7 @@ async def get_voting_token_by_hash(
     election_id: uuid.UUID,
 ) -> Optional[VotingToken]:
     """
-    Fetch a token by its SHA-256 hash, scoped to a specific election.
+    Fetch a token by its stored hash, scoped to a specific election.
     Eagerly loads the electorate so callers can read student_id immediately.
     """
     result = await db.execute(
@@ -423,13 +440,19 @@ async def get_token_statistics(
 # Admin display — electorates with their current token status
 # ---------------------------------------------------------------------------
 
-async def get_electorates_with_tokens(
+async def stream_electorates_with_tokens(
     db: AsyncSession,
     election_id: uuid.UUID,
-) -> list:
+):
     """
-    Return all voters enrolled in this election who currently have an
-    active token, including the plaintext from the in-process cache.
+    Yield voters enrolled in this election who currently have an active
+    token, one dict at a time, including the plaintext from the in-process
+    cache.
+
+    The active-token filter runs in SQL and rows come from a server-side
+    cursor (db.stream), so the full electorate is never materialized —
+    neither as ORM objects nor as each voter's complete token history,
+    which the previous selectinload-based version loaded per voter.
 
     token field will be None if:
       - The cache has expired (>1 hour since generation, or process restarted)
@@ -439,9 +462,22 @@ async def get_electorates_with_tokens(
     from app.models.electorates import Electorate, ElectionVoterRoll
     from app.schemas.electorates import StudentIDConverter
 
-    # Fetch all enrolled voters with their tokens for this election
-    result = await db.execute(
-        select(Electorate)
+    now = datetime.now(timezone.utc)
+    result = await db.stream(
+        select(
+            # Stringified in Python below, NOT via cast(..., String): the
+            # SQL cast is dialect-dependent (dashless hex on SQLite,
+            # dashed on Postgres) and the plaintext cache is keyed by
+            # dashed str(uuid) — a dashless key would never hit.
+            Electorate.id,
+            Electorate.student_id,
+            Electorate.name,
+            Electorate.program,
+            Electorate.phone_number,
+            Electorate.email,
+            Electorate.has_voted,
+            VotingToken.expires_at,
+        )
         .join(
             ElectionVoterRoll,
             and_(
@@ -449,41 +485,32 @@ async def get_electorates_with_tokens(
                 ElectionVoterRoll.election_id == election_id,
             ),
         )
-        .options(selectinload(Electorate.voting_tokens))
+        .join(
+            VotingToken,
+            and_(
+                VotingToken.electorate_id == Electorate.id,
+                VotingToken.election_id == election_id,
+                VotingToken.revoked == False,
+                VotingToken.is_active == True,
+                VotingToken.is_used == False,
+                VotingToken.expires_at > now,
+            ),
+        )
         .where(Electorate.is_deleted == False)
     )
-    electorates = result.scalars().all()
 
-    now = datetime.now(timezone.utc)
-    response = []
-
-    for electorate in electorates:
-        active_token = None
-        for token in (electorate.voting_tokens or []):
-            if token.election_id != election_id:
-                continue
-            if token.revoked or not token.is_active or token.is_used:
-                continue
-            expires_at = token.expires_at
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
-            if expires_at > now:
-                active_token = token
-                break
-
-        if active_token:
-            plaintext = _get_plaintext_token(str(electorate.id))
-            response.append({
-                "id": str(electorate.id),
-                "student_id": StudentIDConverter.to_display(electorate.student_id),
-                "name": electorate.name,
-                "program": electorate.program,
-                "phone_number": electorate.phone_number,
-                "email": electorate.email,
-                "has_voted": electorate.has_voted,
-                "token": plaintext,
-                "token_available": plaintext is not None,
-                "expires_at": active_token.expires_at.isoformat(),
-            })
-
-    return response
\ No newline at end of file
+    async for row in result.mappings():
+        electorate_id = str(row["id"])   # canonical dashed form on every dialect
+        plaintext = _get_plaintext_token(electorate_id)
+        yield {
+            "id": electorate_id,
+            "student_id": StudentIDConverter.to_display(row["student_id"]),
+            "name": row["name"],
+            "program": row["program"],
+            "phone_number": row["phone_number"],
+            "email": row["email"],
+            "has_voted": row["has_voted"],
+            "token": plaintext,
+            "token_available": plaintext is not None,
+            "expires_at": row["expires_at"].isoformat(),
+        }
\ No newline at end of file
@@ -4,26 +4,49 @@ Role-based auth, per-token failure lockout, and in-process rate limiting.
 """
 
 import os
+import re
+import sys
 from uuid import UUID
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from datetime import datetime, timezone
 from typing import Dict, Optional, List
 import logging
-from functools import wraps
-from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 import time
 
+from cachetools import TTLCache
+
 from app.core.database import get_db
 from app.core.config import settings
 from app.models.electorates import Electorate, VotingSession
-from app.utils.security import TokenManager
+from app.utils.jwt_cache import try_decode_token
+from sqlalchemy import update
 from sqlalchemy.future import select
 
 logger = logging.getLogger(__name__)
 
+# Splits "user1:hash1,user2:hash2" on commas that start a new user entry
+# (argon2 hashes contain commas, so a plain split would break them apart)
+_USER_ENTRY_SPLIT = re.compile(r",(?=[a-zA-Z0-9_]+:)")
+
+
+@dataclass(frozen=True, slots=True)
+class UserRecord:
+    """One configured admin/staff user, parsed once from the environment.
+
+    Frozen slots record: attribute reads are fixed-offset loads, and the
+    shared instances can never be mutated by a handler.
+    """
+    username: str
+    password_hash: str
+    role: str
+    permissions: tuple
+
 
 class FlexibleHTTPBearer(HTTPBearer):
     """
@@ -64,9 +87,15 @@ admin_security_scheme = FlexibleHTTPBearer()
 # ROLE-BASED USER CONFIGURATION
 # ============================================================================
 
-def get_all_users_from_env() -> Dict[str, dict]:
-    """Parse all users from environment variables with role-based prefixes."""
-    import re
+@lru_cache(maxsize=1)
+def get_all_users_from_env() -> Dict[str, UserRecord]:
+    """
+    Parse all users from environment variables with role-based prefixes.
+
+    Cached for the process lifetime — the env vars are fixed at startup, and
+    without the cache every authenticated request re-ran the regex split and
+    rebuilt each user's permission list.
+    """
     users = {}
 
     role_map = {
@@ -79,17 +108,18 @@ def get_all_users_from_env() -> Dict[str, dict]:
         raw = os.getenv(env_var, "")
         if not raw:
             continue
-        for entry in re.split(r",(?=[a-zA-Z0-9_]+:)", raw):
+        for entry in _USER_ENTRY_SPLIT.split(raw):
             entry = entry.strip()
             if ":" not in entry:
                 continue
             username, password_hash = entry.split(":", 1)
-            users[username] = {
-                "username": username,
-                "password_hash": password_hash,
-                "role": role,
-                "permissions": _get_permissions_for_role(role),
-            }
+            username = sys.intern(username)
+            users[username] = UserRecord(
+                username=username,
+                password_hash=password_hash,
+                role=role,
+                permissions=tuple(_get_permissions_for_role(role)),
+            )
 
     return users
 
@@ -122,7 +152,7 @@ def _get_permissions_for_role(role: str) -> List[str]:
     return permissions_map.get(role, [])
 
 
-def get_user_by_username(username: str) -> Optional[dict]:
+def get_user_by_username(username: str) -> Optional[UserRecord]:
     return get_all_users_from_env().get(username)
 
 
@@ -154,6 +184,13 @@ def require_permission(permission: str):
 # ADMIN/STAFF AUTHENTICATION
 # ============================================================================
 
+# Verified-token memo: token string -> (exp, user dict).  Admin/staff tokens
+# carry everything needed (no DB row to re-check), so a token that verified
+# once stays valid until its exp — re-decoding the JWT on every dashboard
+# poll and SSE connect is pure repeated work.  exp is still enforced below.
+_verified_user_cache: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(admin_security_scheme),
@@ -163,62 +200,75 @@ async def get_current_user(
     Accepts tokens of type 'admin_access' or 'access' (any role).
     """
     token = credentials.credentials
-    try:
-        payload = TokenManager.decode_token(token)
-        username: str = payload.get("sub")
-        role: str = payload.get("role")
-        token_type: str = payload.get("type")
 
-        if token_type not in ("admin_access", "access", None):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    cached = _verified_user_cache.get(token)
+    if cached is not None:
+        exp, user = cached
+        if time.time() < exp:
+            return user
+
+    # Explicit None check rather than try/except — a malformed or forged
+    # token is the expected case under abuse and costs a branch, not an
+    # exception unwind.
+    payload = try_decode_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        if not username:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    username: str = payload.get("sub")
+    role: str = payload.get("role")
+    token_type: str = payload.get("type")
 
-        if role not in ("admin", "ec_official", "polling_agent"):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Invalid user role",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        user_config = get_user_by_username(username)
-        if not user_config:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    if token_type not in ("admin_access", "access", None):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        if user_config["role"] != role:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Role mismatch",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    if not username:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        return {
-            "username": user_config["username"],
-            "role": user_config["role"],
-            "permissions": user_config["permissions"],
-            "is_admin": user_config["role"] == "admin",
-        }
+    if role not in ("admin", "ec_official", "polling_agent"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid user role",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    except JWTError:
+    user_config = get_user_by_username(username)
+    if not user_config:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
+            detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if user_config.role != role:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Role mismatch",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = {
+        "username": user_config.username,
+        "role": user_config.role,
+        "permissions": user_config.permissions,
+        "is_admin": user_config.role == "admin",
+    }
+    exp = payload.get("exp")
+    if exp:
+        _verified_user_cache[token] = (exp, user)
+    return user
+
 
 async def get_current_admin(current_user: dict = Depends(get_current_user)) -> dict:
     """Require admin role explicitly."""
@@ -239,14 +289,21 @@ async def get_current_voter(
     request: Request,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-) -> Electorate:
+) -> "VoterRecord":
     """
     Validate a voter JWT, verify the session is still live, and return
-    the Electorate ORM object.
+    an immutable VoterRecord snapshot of the voter.
     """
     token = credentials.credentials
+    payload = try_decode_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     try:
-        payload = TokenManager.decode_token(token)
         voter_id: str = payload.get("sub")
         session_id: str = payload.get("session_id")
         token_type: str = payload.get("type")
@@ -265,17 +322,46 @@ async def get_current_voter(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        result = await db.execute(
-            select(Electorate).where(Electorate.id == UUID(voter_id))
-        )
-        voter = result.scalar_one_or_none()
+        vid = UUID(voter_id)
+        voter = _voter_cache.get(vid)
+        if voter is None:
+            # Only the columns the voting endpoints actually read — the
+            # rest stay deferred and must NOT be touched from async code
+            # (deferred access would try a lazy load).  Extend this list
+            # if a new voter endpoint needs another column.
+            result = await db.execute(
+                select(Electorate)
+                .options(
+                    load_only(
+                        Electorate.id,
+                        Electorate.student_id,
+                        Electorate.has_voted,
+                        Electorate.voted_at,
+                        Electorate.is_deleted,
+                        Electorate.is_banned,
+                    )
+                )
+                .where(Electorate.id == vid)
+            )
+            row = result.scalar_one_or_none()
 
-        if not voter or voter.is_deleted or voter.is_banned:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Voter not found",
-                headers={"WWW-Authenticate": "Bearer"},
+            if not row or row.is_deleted or row.is_banned:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Voter not found",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            # Snapshot the row — never cache the session-bound instance
+            # (get_db's rollback-on-error would detach it mid-TTL)
+            voter = VoterRecord(
+                id=row.id,
+                student_id=row.student_id,
+                has_voted=row.has_voted,
+                voted_at=row.voted_at,
+                is_deleted=row.is_deleted,
+                is_banned=row.is_banned,
             )
+            _voter_cache[vid] = voter
 
         if session_id:
             session = await _validate_voter_session(db, UUID(session_id), voter.id)
@@ -288,7 +374,8 @@ async def get_current_voter(
 
         return voter
 
-    except (JWTError, ValueError) as exc:
+    except ValueError as exc:
+        # Malformed UUID in the sub/session_id claims
         logger.warning("Invalid voter authentication: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -297,6 +384,76 @@ async def get_current_voter(
         )
 
 
+@dataclass(frozen=True, slots=True)
+class VoterRecord:
+    """Immutable snapshot of the voter columns the voting endpoints read.
+
+    Cached instead of the live ORM instance: get_db rolls back whenever a
+    handler raises, and rollback expires session-bound instances even with
+    expire_on_commit=False — a cached ORM row would then raise
+    DetachedInstanceError on every hit until the TTL lapsed.
+    """
+    id: UUID
+    student_id: str
+    has_voted: bool
+    voted_at: Optional[datetime]
+    is_deleted: bool
+    is_banned: bool
+
+
+# Voter memo: electorate id -> VoterRecord.  get_current_voter ran the
+# same SELECT on every authenticated call (ballot fetch, vote POST,
+# my-votes) — the single hottest query under load.  Handlers never mutate
+# the voter (vote finalization uses direct UPDATEs), so a frozen snapshot
+# serves every read.  cast_vote evicts on success so has_voted is never
+# stale past a ballot; the double-vote guards (fresh token fetch + DB
+# unique constraint) hold regardless.
+_voter_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def evict_cached_voter(voter_id: UUID) -> None:
+    """Drop a voter from the memo — call after their ballot lands."""
+    _voter_cache.pop(voter_id, None)
+
+
+# Session-state memo: session_id -> (expires_at, is_valid).  Frontends poll
+# /verify-session every few seconds; within the TTL window those polls can
+# answer from this dict instead of a SELECT per poll.  Vote submission and
+# termination paths evict eagerly; the short TTL bounds staleness for
+# terminations that happen in another worker.
+_session_state_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def get_session_state(session_id: UUID) -> Optional[tuple]:
+    """Return a cached (expires_at, is_valid) tuple for a session, if any."""
+    return _session_state_cache.get(session_id)
+
+
+def cache_session_state(session_id: UUID, expires_at: datetime, is_valid: bool) -> None:
+    """Memoize a session's expiry and validity for the poll window."""
+    _session_state_cache[session_id] = (expires_at, is_valid)
+
+
+def evict_session_state(session_id: UUID) -> None:
+    """Drop a session from the memo — call whenever a session is terminated."""
+    _session_state_cache.pop(session_id, None)
+
+
+async def _terminate_session(db: AsyncSession, session_id: UUID, reason: str) -> None:
+    """Invalidate a session with one direct UPDATE + commit (mirrors
+    VotingSession.terminate without the ORM dirty-flush cycle)."""
+    await db.execute(
+        update(VotingSession)
+        .where(VotingSession.id == session_id)
+        .values(
+            is_valid=False,
+            terminated_at=datetime.now(timezone.utc),
+            termination_reason=reason,
+        )
+    )
+    await db.commit()
+
+
 async def _validate_voter_session(
     db: AsyncSession,
     session_id: UUID,
@@ -317,17 +474,28 @@ async def _validate_voter_session(
 
     if not session.is_valid or expires_at < datetime.now(timezone.utc):
         if session.is_valid:
-            session.terminate("Session expired")
-            await db.commit()
+            await _terminate_session(db, session.id, "Session expired")
+        evict_session_state(session.id)
         return None
 
     if session.electorate_id != electorate_id:
-        session.terminate("Session electorate mismatch")
-        await db.commit()
+        await _terminate_session(db, session.id, "Session electorate mismatch")
+        evict_session_state(session.id)
         return None
 
-    session.update_activity("offline")
-    await db.commit()
+    # Throttle the activity write: committing last_activity_at on every
+    # authenticated request doubled the fsyncs of a ballot submission.
+    # Only pay the UPDATE+commit once per debounce window; reads within
+    # the window skip the write entirely.
+    last = session.last_activity_at
+    if last is not None and last.tzinfo is None:
+        last = last.replace(tzinfo=timezone.utc)
+    if last is None or (
+        (datetime.now(timezone.utc) - last).total_seconds()
+        > settings.SESSION_ACTIVITY_DEBOUNCE_SECONDS
+    ):
+        session.update_activity("offline")
+        await db.commit()
     return session
 
 
@@ -337,30 +505,41 @@ async def _validate_voter_session(
 
 class RateLimiter:
     """
-    Simple sliding-window in-memory rate limiter (per process).
+    Token-bucket in-memory rate limiter (per process).
+
+    Each key stores (tokens, last_refill); a check is constant-time float
+    arithmetic — no per-key timestamp list to filter and rebuild on every
+    request, and no lock needed under single-threaded asyncio.  Idle keys
+    age out of the TTLCache instead of accumulating forever.
     Intentionally conservative limits compensate for multi-worker state isolation.
     """
 
+    __slots__ = ("capacity", "refill_rate", "_buckets")
+
     def __init__(self, max_attempts: int, window_seconds: int):
-        self.max_attempts = max_attempts
-        self.window_seconds = window_seconds
-        self._attempts: dict = defaultdict(list)
+        self.capacity = float(max_attempts)
+        self.refill_rate = max_attempts / window_seconds
+        # ttl = one full refill period past last activity, after which the
+        # bucket would be full again anyway
+        self._buckets: TTLCache = TTLCache(maxsize=50_000, ttl=window_seconds * 2)
 
     def is_rate_limited(self, identifier: str) -> bool:
-        now = time.time()
-        cutoff = now - self.window_seconds
-        # Expire old entries
-        self._attempts[identifier] = [
-            t for t in self._attempts[identifier] if t > cutoff
-        ]
-        if len(self._attempts[identifier]) >= self.max_attempts:
+        # Bind attributes once — this runs on every request to a limited
+        # endpoint, so even LOAD_ATTR overhead is worth shaving.
+        buckets = self._buckets
+        capacity = self.capacity
+        now = time.monotonic()
+        tokens, last_update = buckets.get(identifier, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_update) * self.refill_rate)
+        if tokens < 1.0:
+            buckets[identifier] = (tokens, now)
             return True
-        self._attempts[identifier].append(now)
+        buckets[identifier] = (tokens - 1.0, now)
         return False
 
     def clear(self, identifier: str):
         """Explicitly clear attempts for an identifier (e.g. after successful auth)."""
-        self._attempts.pop(identifier, None)
+        self._buckets.pop(identifier, None)
 
 
 auth_rate_limiter = RateLimiter(
@@ -373,12 +552,44 @@ voting_rate_limiter = RateLimiter(
 )
 
 
+# Resolved once per request by ClientIPMiddleware; decorators read it
+# instead of re-extracting from the Request (and, in the voting case,
+# scanning *args to find one).
+client_ip_var: ContextVar[str] = ContextVar("client_ip", default="unknown")
+
+
+class ClientIPMiddleware:
+    """Pure-ASGI middleware that stashes the client IP in a ContextVar.
+
+    uvicorn's --proxy-headers support rewrites scope["client"] from
+    X-Forwarded-For before this runs, so no header parsing is needed here.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            client = scope.get("client")
+            client_ip_var.set(client[0] if client else "unknown")
+        await self.app(scope, receive, send)
+
+
+# Trusted IPs bypass the limiters entirely — one frozenset membership
+# test, built once at import from the comma-separated setting.
+_rl_whitelist = frozenset(
+    ip.strip() for ip in settings.RATE_LIMIT_WHITELIST.split(",") if ip.strip()
+)
+
+
 def rate_limit_auth(func):
     """Decorator: rate-limit authentication endpoints by client IP."""
     @wraps(func)
     async def wrapper(request: Request, *args, **kwargs):
-        client_ip = getattr(request.client, "host", "unknown") if request.client else "unknown"
-        if auth_rate_limiter.is_rate_limited(client_ip):
+        client_ip = client_ip_var.get()
+        if client_ip not in _rl_whitelist and auth_rate_limiter.is_rate_limited(client_ip):
             logger.warning("Auth rate limit hit for IP: %s", client_ip)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -392,16 +603,8 @@ def rate_limit_voting(func):
     """Decorator: rate-limit voting endpoints by client IP."""
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        request: Optional[Request] = kwargs.get("request") or next(
-            (a for a in args if isinstance(a, Request)), None
-        )
-        if not request:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Request object not found in voting rate limiter",
-            )
-        client_ip = getattr(request.client, "host", "unknown") if request.client else "unknown"
-        if voting_rate_limiter.is_rate_limited(client_ip):
+        client_ip = client_ip_var.get()
+        if client_ip not in _rl_whitelist and voting_rate_limiter.is_rate_limited(client_ip):
             logger.warning("Voting rate limit hit for IP: %s", client_ip)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -446,9 +649,11 @@ __all__ = [
     "get_current_user",
     "get_current_admin",
     "get_current_voter",
+    "VoterRecord",
     "require_permission",
     "rate_limit_auth",
     "rate_limit_voting",
+    "ClientIPMiddleware",
     "get_all_users_from_env",
     "SecurityAuditLogger",
     "auth_rate_limiter",
@@ -5,6 +5,10 @@ Validates every individual vote request before it is written to the database.
 Called once per portfolio in a ballot submission, AFTER the session JWT has
 already been verified by get_current_voter() in auth_middleware.py.
 
+The DB lookups are batched: the route calls prefetch_ballot_context() once
+per ballot (four queries regardless of ballot size), and the per-vote
+validation runs entirely against the prefetched dicts/sets.
+
 Validation order (fail-fast):
   1. Election is currently OPEN
   2. Portfolio belongs to this election and is active
@@ -15,20 +19,30 @@ Validation order (fail-fast):
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.crud_candidates import get_candidate_engine
-from app.crud.crud_portfolios import get_portfolio_engine
-from app.crud.crud_votes import check_electorate_voted_for_portfolio
+from cachetools import TTLCache
+
+from app.crud.crud_candidates import get_candidates_by_ids
+from app.crud.crud_portfolios import get_portfolios_by_ids
+from app.crud.crud_votes import get_voted_portfolio_ids
 from app.crud.crud_electorates import is_electorate_enrolled
 from app.models.electorates import ElectionStatus, VotingToken
+from app.utils.ballot_cache import ballot_version
 
 logger = logging.getLogger(__name__)
 
+# Portfolio/candidate reference data is static during a vote window and
+# most ballots reference the same full slate, so the two IN-list queries
+# repeat identically for every voter.  Keyed by (election, id set, ballot
+# version): any admin edit bumps the version and orphans stale entries,
+# and the TTL bounds cross-worker staleness.
+_ref_data_cache: TTLCache = TTLCache(maxsize=512, ttl=30)
+
 
 class VotingSecurityValidator:
     """
@@ -78,26 +92,70 @@ class VotingSecurityValidator:
             )
 
     @staticmethod
-    async def validate_vote_request(
+    async def prefetch_ballot_context(
         db: AsyncSession,
+        election_id: UUID,
+        electorate_id: UUID,
+        portfolio_ids: List[UUID],
+        candidate_ids: List[UUID],
+    ) -> Dict[str, Any]:
+        """
+        Batch the per-ballot DB lookups: enrollment, every referenced
+        portfolio, every referenced candidate, and the already-voted set.
+
+        Four queries total regardless of ballot size — the per-vote checks
+        in validate_vote_request then run against these dicts/sets without
+        touching the database (previously each vote cost four round-trips).
+
+        The portfolio and candidate lookups are additionally memoised in
+        _ref_data_cache: they are reference data, identical across voters,
+        so most ballots skip those two queries entirely.  The per-voter
+        lookups (enrollment, already-voted set) are never cached.
+        """
+        version = ballot_version()
+        pf_key = ("portfolios", election_id, version, tuple(sorted(portfolio_ids)))
+        cd_key = ("candidates", election_id, version, tuple(sorted(candidate_ids)))
+
+        portfolios = _ref_data_cache.get(pf_key)
+        if portfolios is None:
+            portfolios = await get_portfolios_by_ids(db, portfolio_ids, election_id)
+            _ref_data_cache[pf_key] = portfolios
+
+        candidates = _ref_data_cache.get(cd_key)
+        if candidates is None:
+            candidates = await get_candidates_by_ids(db, candidate_ids, election_id)
+            _ref_data_cache[cd_key] = candidates
+
+        return {
+            "enrolled": await is_electorate_enrolled(db, electorate_id, election_id),
+            "portfolios": portfolios,
+            "candidates": candidates,
+            "voted_portfolio_ids": await get_voted_portfolio_ids(
+                db, electorate_id, portfolio_ids, election_id
+            ),
+        }
+
+    @staticmethod
+    async def validate_vote_request(
         voting_token: VotingToken,
         election_id: UUID,
         electorate_id: UUID,
         portfolio_id: UUID,
         candidate_id: UUID,
         election,               # Election ORM object — already loaded by the route
+        context: Dict[str, Any],  # from prefetch_ballot_context
     ) -> Dict[str, Any]:
         """
         Validate a single vote within a ballot submission.
 
         Args:
-            db:             Database session
             voting_token:   The voter's VotingToken ORM object
             election_id:    The active election's UUID
             electorate_id:  The voter's UUID (from the session JWT)
             portfolio_id:   The portfolio being voted on
             candidate_id:   The chosen candidate
             election:       The Election ORM object (loaded by the route)
+            context:        Prefetched ballot context (no DB access here)
 
         Returns:
             {"valid": True, "portfolio": <Portfolio>, "candidate": <Candidate>}
@@ -113,8 +171,7 @@ class VotingSecurityValidator:
         await VotingSecurityValidator.validate_token_still_valid(voting_token)
 
         # ── 3. Voter must be on this election's roll ──────────────────────
-        enrolled = await is_electorate_enrolled(db, electorate_id, election_id)
-        if not enrolled:
+        if not context["enrolled"]:
             logger.warning(
                 "Voter %s attempted to vote but is not on the roll for election %s",
                 electorate_id,
@@ -126,7 +183,9 @@ class VotingSecurityValidator:
             )
 
         # ── 4. Portfolio must exist, belong to this election, and be active
-        portfolio = await get_portfolio_engine(db, portfolio_id, election_id)
+        # (the prefetch query filters on election_id, so presence in the
+        # dict already implies election membership)
+        portfolio = context["portfolios"].get(portfolio_id)
         if not portfolio:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -137,21 +196,9 @@ class VotingSecurityValidator:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="This portfolio is not currently accepting votes",
             )
-        if str(portfolio.election_id) != str(election_id):
-            # Belt-and-suspenders: get_portfolio_engine already filters by
-            # election_id, but an explicit check makes tampering attempts obvious.
-            logger.warning(
-                "Portfolio %s does not belong to election %s",
-                portfolio_id,
-                election_id,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Portfolio does not belong to this election",
-            )
 
         # ── 5. Candidate must exist, belong to this election & portfolio ──
-        candidate = await get_candidate_engine(db, candidate_id, election_id)
+        candidate = context["candidates"].get(candidate_id)
         if not candidate:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -174,10 +221,7 @@ class VotingSecurityValidator:
             )
 
         # ── 6. Voter must not have already voted for this portfolio ───────
-        already_voted = await check_electorate_voted_for_portfolio(
-            db, electorate_id, portfolio_id, election_id
-        )
-        if already_voted:
+        if portfolio_id in context["voted_portfolio_ids"]:
             logger.warning(
                 "Double-vote attempt: voter %s already voted for portfolio %s in election %s",
                 electorate_id,
@@ -49,8 +49,9 @@ from sqlalchemy import (
     TIMESTAMP,
     UniqueConstraint,
     func,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
 
@@ -186,6 +187,16 @@ class Electorate(Base):
     the same vote-submission transaction.
     """
     __tablename__ = "students"
+    __table_args__ = (
+        # A full B-tree on a boolean splits into two huge buckets and
+        # costs write amplification on every vote; the partial index
+        # serves the "who hasn't voted yet" admin queries directly.
+        Index(
+            "ix_students_pending",
+            "student_id",
+            postgresql_where=text("has_voted = false"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, index=True
@@ -214,7 +225,7 @@ class Electorate(Base):
     # MUST be set atomically with VotingToken.mark_voted() in the same
     # vote-submission transaction.  Never update this field on its own.
     has_voted: Mapped[bool] = mapped_column(
-        Boolean, default=False, nullable=False, index=True
+        Boolean, default=False, nullable=False
     )
     voted_at: Mapped[Optional[datetime]] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
@@ -255,6 +266,9 @@ class Electorate(Base):
         tokens = self.__dict__.get("voting_tokens")
         if not tokens:
             return None
+        # One clock read for the whole collection.  The per-token tzinfo
+        # fix-up stays: ORM hydration and Core inserts bypass the
+        # validates("expires_at") hook, and SQLite rows are naive.
         now = datetime.now(timezone.utc)
         for token in tokens:
             if str(token.election_id) != str(election_id):
@@ -369,7 +383,7 @@ class VotingToken(Base):
       REVOKED →  manually revoked OR auto-revoked after max_failures bad attempts
 
     Security layers:
-      1. Token is hashed (SHA-256) at rest — plaintext never stored in the DB.
+      1. Token is hashed (BLAKE2b-256) at rest — plaintext never stored in the DB.
       2. Student ID is required as a second factor at the verify endpoint.
       3. failure_count triggers auto-revoke after TOKEN_MAX_FAILURES bad attempts.
       4. UniqueConstraint(election_id, electorate_id) — one token per voter per election.
@@ -379,6 +393,15 @@ class VotingToken(Base):
         UniqueConstraint(
             "election_id", "electorate_id", name="uq_token_per_election_voter"
         ),
+        # Partial index matching the active-token predicate used by
+        # get_active_token_for_electorate — the planner hits only live
+        # tokens instead of scanning the voter's whole token history.
+        Index(
+            "ix_voting_tokens_active",
+            "electorate_id",
+            "expires_at",
+            postgresql_where=text("revoked = false AND is_active = true"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -395,7 +418,7 @@ class VotingToken(Base):
         index=True,
     )
     token_hash: Mapped[str] = mapped_column(
-        String(64),        # SHA-256 hex digest is exactly 64 chars
+        String(64),        # 32-byte (BLAKE2b-256) hex digest is exactly 64 chars
         nullable=False,
         unique=True,
         index=True,
@@ -446,10 +469,22 @@ class VotingToken(Base):
     # Business logic helpers
     # ------------------------------------------------------------------
 
+    @validates("expires_at")
+    def _coerce_expires_at(self, key, value: datetime) -> datetime:
+        """Normalise expires_at to tz-aware UTC at assignment time.
+
+        Write-time guard only — ORM row hydration and Core inserts do not
+        pass through validates(), so readers still normalise on use."""
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
     @property
     def is_valid(self) -> bool:
         """True if the token can still be used to authenticate."""
-        now = datetime.now(timezone.utc)
+        # The validates hook only fires on attribute assignment — rows
+        # hydrated by the ORM or written via Core insert() bypass it, and
+        # SQLite returns naive datetimes — so reads still normalise.
         expires = self.expires_at
         if expires.tzinfo is None:
             expires = expires.replace(tzinfo=timezone.utc)
@@ -457,7 +492,7 @@ class VotingToken(Base):
             self.is_active
             and not self.revoked
             and not self.is_used
-            and expires > now
+            and expires > datetime.now(timezone.utc)
         )
 
     def increment_failure(self, max_failures: int = 5) -> bool:
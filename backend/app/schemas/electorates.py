@@ -22,17 +22,57 @@ Key design notes:
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
+import re
 import uuid
 from datetime import datetime
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer, model_validator
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_serializer, field_validator, model_validator
 
 
 # ---------------------------------------------------------------------------
 # Student ID helpers
 # ---------------------------------------------------------------------------
 
+# Compiled once at import — validate() runs on every schema parse, so a
+# single C-level fullmatch beats the old split/isalpha/isdigit branch tree.
+# One pattern per separator style; mixed separators match neither.
+_SID_SLASH = re.compile(r"[A-Za-z]{3}/\d{4}/\d{2}")
+_SID_HYPHEN = re.compile(r"[A-Za-z]{3}-\d{4}-\d{2}")
+
+# Case-fold and slash→hyphen in one translate() pass — normalise runs per
+# record during bulk ingest, where .upper().replace() costs two extra
+# intermediate strings each.
+_TO_STORAGE_TABLE = str.maketrans(
+    "/abcdefghijklmnopqrstuvwxyz", "-ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+_TO_DISPLAY_TABLE = str.maketrans("-", "/")
+
+_VALID_YEAR_LEVELS = frozenset((100, 200, 300, 400, 500, 600))
+
+# Length/shape constraints expressed as types so pydantic-core enforces
+# them natively instead of calling back into Python field validators.
+PhoneStr = Annotated[str, StringConstraints(max_length=14)]
+EmailAddr = Annotated[str, StringConstraints(max_length=255, pattern=r"^[^@]+@[^@]+$")]
+
+
+# The roster of distinct student IDs is fixed per election, while the
+# conversions run once per row per response — memoising turns the repeat
+# conversions into dict hits.  Module-level because lru_cache does not
+# stack cleanly on staticmethods.
+@lru_cache(maxsize=4096)
+def _to_storage_cached(student_id: str) -> str:
+    return student_id.strip().translate(_TO_STORAGE_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _to_display_cached(student_id: str) -> str:
+    return student_id.strip().translate(_TO_DISPLAY_TABLE)
+
+
 class StudentIDConverter:
     """
     Handle student ID conversion between storage and display formats.
@@ -49,21 +89,21 @@ class StudentIDConverter:
         """MLS/0201/19  →  MLS-0201-19"""
         if not student_id:
             return student_id
-        return student_id.strip().upper().replace("/", "-")
+        return _to_storage_cached(student_id)
 
     @staticmethod
     def to_display(student_id: str) -> str:
         """MLS-0201-19  →  MLS/0201/19"""
         if not student_id:
             return student_id
-        return student_id.strip().replace("-", "/")
+        return _to_display_cached(student_id)
 
     @staticmethod
     def normalize(student_id: str) -> str:
         """Normalise to storage format regardless of input (slash or hyphen)."""
         if not student_id:
             return student_id
-        return student_id.strip().upper().replace("/", "-")
+        return _to_storage_cached(student_id)
 
     @staticmethod
     def validate(student_id: str) -> bool:
@@ -76,27 +116,9 @@ class StudentIDConverter:
             return False
 
         student_id = student_id.strip()
-        has_slashes = "/" in student_id
-        has_hyphens = "-" in student_id
-
-        if has_slashes and has_hyphens:
-            return False
-        if not (has_slashes or has_hyphens):
-            return False
-
-        sep = "/" if has_slashes else "-"
-        parts = student_id.split(sep)
-
-        if len(parts) != 3:
-            return False
-        if not (parts[0].isalpha() and len(parts[0]) == 3):
-            return False
-        if not (parts[1].isdigit() and len(parts[1]) == 4):
-            return False
-        if not (parts[2].isdigit() and len(parts[2]) == 2):
-            return False
-
-        return True
+        return bool(
+            _SID_SLASH.fullmatch(student_id) or _SID_HYPHEN.fullmatch(student_id)
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -110,8 +132,8 @@ class ElectorateBase(BaseModel):
     name: Optional[str] = None
     program: Optional[str] = None
     year_level: Optional[int] = None
-    phone_number: Optional[str] = None
-    email: Optional[str] = None
+    phone_number: Optional[PhoneStr] = None
+    email: Optional[EmailAddr] = None
 
     @field_validator("student_id", mode="before")
     @classmethod
@@ -126,27 +148,10 @@ class ElectorateBase(BaseModel):
     @field_validator("year_level")
     @classmethod
     def validate_year_level(cls, v: Optional[int]) -> Optional[int]:
-        if v is not None and v not in {100, 200, 300, 400, 500, 600}:
+        if v is not None and v not in _VALID_YEAR_LEVELS:
             raise ValueError("year_level must be one of: 100, 200, 300, 400, 500, 600")
         return v
 
-    @field_validator("phone_number")
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and len(v) > 14:
-            raise ValueError("phone_number must be at most 14 characters")
-        return v
-
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            if len(v) > 255:
-                raise ValueError("email must be at most 255 characters")
-            if "@" not in v:
-                raise ValueError("email must be a valid email address")
-        return v
-
 
 class ElectorateCreate(ElectorateBase):
     pass
@@ -159,31 +164,14 @@ class ElectorateUpdate(BaseModel):
     name: Optional[str] = None
     program: Optional[str] = None
     year_level: Optional[int] = None
-    phone_number: Optional[str] = None
-    email: Optional[str] = None
+    phone_number: Optional[PhoneStr] = None
+    email: Optional[EmailAddr] = None
 
     @field_validator("student_id", mode="before")
     @classmethod
     def normalise_student_id(cls, v: Optional[str]) -> Optional[str]:
         return StudentIDConverter.normalize(v) if v else v
 
-    @field_validator("phone_number")
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and len(v) > 14:
-            raise ValueError("phone_number must be at most 14 characters")
-        return v
-
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            if len(v) > 255:
-                raise ValueError("email must be at most 255 characters")
-            if "@" not in v:
-                raise ValueError("email must be a valid email address")
-        return v
-
 
 class ElectorateOut(BaseModel):
     """
@@ -209,13 +197,13 @@ class ElectorateOut(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @model_serializer(mode="wrap")
-    def _serialise(self, handler):
-        data = handler(self)
+    # Field-level serialiser so only this one string crosses into Python;
+    # the wrap-mode model serialiser it replaces forced every field of
+    # every row through a Python callback on bulk list responses.
+    @field_serializer("student_id")
+    def _serialise_student_id(self, v: str) -> str:
         # Convert storage format (hyphens) → display format (slashes)
-        if data.get("student_id"):
-            data["student_id"] = StudentIDConverter.to_display(data["student_id"])
-        return data
+        return StudentIDConverter.to_display(v) if v else v
 
 
 # ---------------------------------------------------------------------------
@@ -551,9 +539,13 @@ class VotingSessionOut(BaseModel):
 # ---------------------------------------------------------------------------
 
 class TokenVerificationRequest(BaseModel):
-    """Sent by a voting station when a voter submits their token + student ID."""
-    token: str
-    student_id: str
+    """Sent by a voting station when a voter submits their token + student ID.
+
+    Length caps reject oversized garbage at the parsing layer, before the
+    handler spends any normalisation/hashing/DB work on it.
+    """
+    token: str = Field(..., min_length=1, max_length=32)
+    student_id: str = Field(..., min_length=1, max_length=64)
 
 
 class TokenVerificationResponse(BaseModel):
@@ -608,6 +600,16 @@ class PortfolioOut(PortfolioBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "PortfolioOut":
+        """Build from a TRUSTED ORM row via model_construct, skipping
+        validation — the row came straight out of the DB, so re-running
+        field validators per row on read paths is pure overhead."""
+        return cls.model_construct(**{
+            name: getattr(obj, name, field.default)
+            for name, field in cls.model_fields.items()
+        })
+
 
 # ---------------------------------------------------------------------------
 # Candidate schemas
@@ -647,6 +649,19 @@ class CandidateOut(CandidateBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "CandidateOut":
+        """Trusted ORM-row constructor — see PortfolioOut.from_orm_fast.
+        Caller must have eagerly loaded .portfolio (or left it None);
+        model_construct will not trigger a lazy load for it."""
+        data = {
+            name: getattr(obj, name, field.default)
+            for name, field in cls.model_fields.items()
+        }
+        if data.get("portfolio") is not None:
+            data["portfolio"] = PortfolioOut.from_orm_fast(data["portfolio"])
+        return cls.model_construct(**data)
+
 
 # ---------------------------------------------------------------------------
 # Vote schemas
@@ -667,17 +682,17 @@ class VotingCreation(BaseModel):
 
     @field_validator("votes")
     @classmethod
-    def must_not_be_empty(cls, v: List[VoteCreate]) -> List[VoteCreate]:
+    def validate_ballot(cls, v: List[VoteCreate]) -> List[VoteCreate]:
         if not v:
             raise ValueError("At least one vote is required")
-        return v
-
-    @field_validator("votes")
-    @classmethod
-    def unique_portfolios(cls, v: List[VoteCreate]) -> List[VoteCreate]:
-        ids = [vote.portfolio_id for vote in v]
-        if len(ids) != len(set(ids)):
-            raise ValueError("Cannot vote for the same portfolio more than once")
+        # Single pass with early exit on the first duplicate — no
+        # intermediate id list to build and compare against a set
+        seen = set()
+        for vote in v:
+            pid = vote.portfolio_id
+            if pid in seen:
+                raise ValueError("Cannot vote for the same portfolio more than once")
+            seen.add(pid)
         return v
 
 
@@ -18,30 +18,37 @@ DESIGN NOTES
 ────────────
 - StudentIDConverter is imported from schemas — NOT redefined here.
 - All generation methods require election_id — tokens are election-scoped.
-- _revoke_existing_tokens() issues a direct UPDATE+flush (no commit) so the
-  revoke and the subsequent INSERT share the same transaction. This prevents
-  the UniqueViolationError on uq_token_per_election_voter which fired when
-  revoke_all_tokens_for_electorate() committed independently and the constraint
-  still saw the old row at INSERT time.
+- Revocation of superseded tokens is a single bulk UPDATE+flush (no commit)
+  per batch, so the revoke and the subsequent INSERT share the same
+  transaction. This prevents the UniqueViolationError on
+  uq_token_per_election_voter which fired when
+  revoke_all_tokens_for_electorate() committed independently and the
+  constraint still saw the old row at INSERT time.
 - generate_tokens_for_portfolio() has been removed: it relied on
   Vote.electorate_id which does not exist (Vote is anonymized).
   Use generate_tokens_for_all_electorates() with exclude_voted=True instead.
 """
 
-import hashlib
+import asyncio
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, select, update
+from sqlalchemy import and_, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.crud.crud_voting_tokens import _cache_plaintext_token, _evict_plaintext_token
+from app.crud.crud_voting_tokens import (
+    _cache_plaintext_token,
+    _evict_plaintext_token,
+    _hash_token,
+)
 from app.models.electorates import Electorate, ElectionVoterRoll, VotingToken
 from app.schemas.electorates import StudentIDConverter
+from app.utils.cache import async_cached
+from app.utils.uuid_pool import fast_uuid4_batch
 
 logger = logging.getLogger(__name__)
 
@@ -71,50 +78,50 @@ class BulkTokenGenerator:
 
     @staticmethod
     def _hash_token(plaintext: str) -> str:
-        """Normalise and SHA-256 hash a plaintext token for DB storage."""
-        clean = plaintext.replace("-", "").replace(" ", "").upper()
-        return hashlib.sha256(clean.encode()).hexdigest()
+        """
+        Normalise and hash a plaintext token for DB storage.
+        Delegates to crud_voting_tokens._hash_token so generation and lookup
+        can never drift onto different algorithms.
+        """
+        return _hash_token(plaintext)
 
-    async def _revoke_existing_tokens(
-        self,
-        db: AsyncSession,
-        electorate_id: UUID,
+    @classmethod
+    def _build_token_batch(
+        cls,
         election_id: UUID,
-    ) -> None:
+        electorate_ids: List[UUID],
+        expires_at: datetime,
+        issued_plaintexts: Set[str],
+    ) -> Tuple[List[Dict[str, Any]], Dict[UUID, str]]:
         """
-        Revoke all existing un-revoked tokens for a voter in this election.
-
-        FIX: Uses flush() NOT commit() so this UPDATE and the subsequent INSERT
-        share the same transaction. The old row is marked revoked and flushed
-        to the DB before the new row is added, satisfying the unique constraint
-        uq_token_per_election_voter which requires (election_id, electorate_id)
-        to be unique — the constraint must allow multiple rows when filtered by
-        revoked=False, OR we must delete the old row entirely.
-
-        Since the constraint has no partial index on revoked=False, we DELETE
-        the old revoked rows instead of updating them, then flush before INSERT.
+        Pure CPU part of a generation batch: random plaintexts, hashes, and
+        the INSERT rows.  No DB or cache access, so it can run on an executor
+        thread — mutates issued_plaintexts to keep the cross-batch dedupe.
         """
-        await db.execute(
-            update(VotingToken)
-            .where(
-                and_(
-                    VotingToken.electorate_id == electorate_id,
-                    VotingToken.election_id == election_id,
-                    VotingToken.revoked == False,
-                )
-            )
-            .values(
-                revoked=True,
-                revoked_at=datetime.now(timezone.utc),
-                revoked_reason="Superseded by new token",
-                is_active=False,
-            )
-        )
-        # flush() sends the UPDATE to the DB within the current transaction
-        # so the unique constraint sees the row as revoked before the INSERT.
-        # We do NOT commit here — the whole revoke+insert is one atomic unit.
-        await db.flush()
-        _evict_plaintext_token(str(electorate_id))
+        token_rows: List[Dict[str, Any]] = []
+        plaintexts: Dict[UUID, str] = {}
+        # One private random block for the whole batch — thread-safe on the
+        # executor, unlike slicing the shared module pool from here
+        token_ids = fast_uuid4_batch(len(electorate_ids))
+        for token_id, electorate_id in zip(token_ids, electorate_ids):
+            plaintext = cls._generate_token()
+            while plaintext in issued_plaintexts:
+                plaintext = cls._generate_token()
+            issued_plaintexts.add(plaintext)
+            plaintexts[electorate_id] = plaintext
+            token_rows.append({
+                "id": token_id,   # pre-drawn block — avoids a syscall per row
+                "election_id": election_id,
+                "electorate_id": electorate_id,
+                "token_hash": cls._hash_token(plaintext),
+                "expires_at": expires_at,
+                "is_active": True,
+                "revoked": False,
+                "is_used": False,
+                "failure_count": 0,
+                "usage_count": 0,
+            })
+        return token_rows, plaintexts
 
     # ---------------------------------------------------------------------------
     # Core generation
@@ -129,22 +136,33 @@ class BulkTokenGenerator:
         """
         Generate (or regenerate) tokens for a specific list of voters.
 
-        Steps per voter:
-          1. Skip if already voted in this election (per ElectionVoterRoll)
-          2. Skip if not enrolled in this election
-          3. Revoke + flush existing tokens for this election
-          4. Generate a new 4-char plaintext token
-          5. Add new VotingToken to session
-          6. Cache the plaintext for the admin display window
-
-        Commits per batch of 500 so a mid-run failure doesn't roll back
-        the entire generation run.
+        Steps per batch of 500:
+          1. Fetch eligible voters (enrolled, not deleted/banned) in one query
+          2. Revoke all their existing tokens with ONE bulk UPDATE + flush
+          3. Generate plaintexts and build all new token rows in memory
+          4. Insert the whole batch with ONE multi-row INSERT
+          5. Cache the plaintexts for the admin display window
+          6. Commit the batch
+
+        The previous implementation issued a revoke UPDATE, an INSERT, and a
+        flush per voter — thousands of round trips for a full-roll run.  The
+        bulk UPDATE + single INSERT keeps one round trip each per batch while
+        still satisfying uq_token_per_election_voter (the revoke is flushed
+        before the INSERT within the same transaction).
+
+        Commits per batch so a mid-run failure doesn't roll back the entire
+        generation run.
         """
         tokens: List[Dict[str, Any]] = []
         generated_count = 0
         skipped_voted = 0
         skipped_not_enrolled = 0
 
+        # Dedupe plaintexts within the run — with a 32^4 keyspace, batches of
+        # hundreds have a non-trivial in-batch birthday collision chance, and
+        # token_hash is globally unique.
+        issued_plaintexts: set = set()
+
         batch_size = 500
         for i in range(0, len(electorate_ids), batch_size):
             batch_ids = electorate_ids[i: i + batch_size]
@@ -168,38 +186,61 @@ class BulkTokenGenerator:
             )
             rows = result.all()
 
+            eligible = []
             for electorate, roll_entry in rows:
                 if roll_entry.has_voted:
                     skipped_voted += 1
-                    continue
+                else:
+                    eligible.append(electorate)
 
-                # FIX: revoke existing tokens with flush() before adding new one.
-                # This keeps the revoke UPDATE and the INSERT in the same
-                # transaction, preventing UniqueViolationError on
-                # uq_token_per_election_voter (election_id, electorate_id).
-                await self._revoke_existing_tokens(db, electorate.id, election_id)
+            if not eligible:
+                continue
 
-                plaintext = self._generate_token()
-                expires_at = datetime.now(timezone.utc) + timedelta(
-                    hours=settings.VOTING_TOKEN_EXPIRE_HOURS
+            # Bulk-revoke existing tokens for every voter in this batch.
+            # flush() sends the UPDATE within the current transaction so
+            # uq_token_per_election_voter sees the old rows as revoked
+            # before the INSERT below.
+            eligible_ids = [e.id for e in eligible]
+            await db.execute(
+                update(VotingToken)
+                .where(
+                    and_(
+                        VotingToken.electorate_id.in_(eligible_ids),
+                        VotingToken.election_id == election_id,
+                        VotingToken.revoked == False,
+                    )
                 )
-
-                voting_token = VotingToken(
-                    election_id=election_id,
-                    electorate_id=electorate.id,
-                    token_hash=self._hash_token(plaintext),
-                    expires_at=expires_at,
-                    is_active=True,
-                    revoked=False,
-                    is_used=False,
-                    failure_count=0,
-                    usage_count=0,
+                .values(
+                    revoked=True,
+                    revoked_at=datetime.now(timezone.utc),
+                    revoked_reason="Superseded by new token",
+                    is_active=False,
                 )
-                db.add(voting_token)
+            )
+            await db.flush()
 
-                # flush() so the new row is visible before next voter's revoke check
-                await db.flush()
+            expires_at = datetime.now(timezone.utc) + timedelta(
+                hours=settings.VOTING_TOKEN_EXPIRE_HOURS
+            )
+
+            # Random generation + hashing for a full batch is CPU-bound
+            # Python; run it on an executor thread so the event loop (SSE
+            # streams, other admin traffic) stays responsive during a
+            # full-roll generation run.
+            loop = asyncio.get_running_loop()
+            token_rows, plaintexts = await loop.run_in_executor(
+                None,
+                self._build_token_batch,
+                election_id,
+                eligible_ids,
+                expires_at,
+                issued_plaintexts,
+            )
 
+            expires_at_iso = expires_at.isoformat()
+            for electorate in eligible:
+                plaintext = plaintexts[electorate.id]
+                _evict_plaintext_token(str(electorate.id))
                 _cache_plaintext_token(str(electorate.id), plaintext)
 
                 display_id = StudentIDConverter.to_display(electorate.student_id)
@@ -208,11 +249,14 @@ class BulkTokenGenerator:
                     "student_id": display_id,
                     "name": electorate.name or display_id,
                     "token": plaintext,
-                    "expires_at": expires_at.isoformat(),
+                    "expires_at": expires_at_iso,
                     "created": True,
                 })
                 generated_count += 1
 
+            # Single multi-row INSERT for the whole batch
+            await db.execute(insert(VotingToken), token_rows)
+
             # Commit each batch atomically
             await db.commit()
 
@@ -298,12 +342,16 @@ class BulkTokenGenerator:
     # Statistics
     # ---------------------------------------------------------------------------
 
+    @async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
     async def get_token_statistics(
         self,
         db: AsyncSession,
         election_id: UUID,
     ) -> Dict[str, Any]:
-        """Token and turnout statistics for a specific election."""
+        """
+        Token and turnout statistics for a specific election.
+        Cached for STATS_CACHE_TTL_SECONDS — polled every tick by the SSE stream.
+        """
         from sqlalchemy import func
         from app.crud.crud_voting_tokens import get_token_statistics
 
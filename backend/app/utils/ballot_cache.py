@@ -0,0 +1,76 @@
+"""
+Process-local ballot versioning for ETag / 304 support on GET /ballot.
+
+The ballot (active portfolios + candidates) is read constantly during a
+vote window but changes only when an admin edits portfolios or candidates.
+Each portfolio/candidate write path calls bump_ballot_version(), which
+changes the ETag this module hands out, so repeat polls from the same
+client collapse into empty 304 responses.
+
+The app runs multiple uvicorn workers and each keeps its own version
+counter, so a mutation served by one worker is invisible to the others'
+counters.  Two safeguards keep that correct:
+
+  * the ETag embeds a per-process random seed, so a tag minted by one
+    worker never false-matches in another, and
+  * the ETag embeds a coarse time bucket, so even a worker that never
+    saw the mutation stops serving 304s within ETAG_BUCKET_SECONDS.
+"""
+
+import secrets
+import time
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+
+# Bounds cross-worker staleness of 304 responses; mirrors the SSE
+# idle-refresh fallback used for the same multi-worker reason.
+ETAG_BUCKET_SECONDS = 30
+
+_SEED = secrets.token_hex(4)
+_version = 0
+
+# Pre-encoded response bodies, keyed by ETag.  The tag already encodes the
+# version counter and time bucket, so an entry can never be served after
+# the ballot it describes has changed; the TTL just caps memory.
+_body_cache: TTLCache = TTLCache(maxsize=4, ttl=ETAG_BUCKET_SECONDS)
+
+
+def bump_ballot_version() -> None:
+    """Invalidate outstanding ballot ETags. Call after any portfolio or
+    candidate write — cheap enough to call unconditionally."""
+    global _version
+    _version += 1
+
+
+def ballot_version() -> int:
+    """Current ballot version — cache keys that embed it are invalidated
+    by any portfolio/candidate write in this process."""
+    return _version
+
+
+def ballot_etag(election_id: UUID) -> str:
+    """Weak ETag for the current ballot of the given election."""
+    bucket = int(time.time() // ETAG_BUCKET_SECONDS)
+    return f'W/"{_SEED}-{election_id}-{_version}-{bucket}"'
+
+
+def get_cached_ballot(etag: str) -> Optional[bytes]:
+    """Return the pre-encoded JSON body for this ETag, if still cached."""
+    return _body_cache.get(etag)
+
+
+def store_cached_ballot(etag: str, body: bytes) -> None:
+    """Cache an encoded ballot body under its ETag."""
+    _body_cache[etag] = body
+
+
+__all__ = [
+    "ballot_etag",
+    "ballot_version",
+    "bump_ballot_version",
+    "get_cached_ballot",
+    "store_cached_ballot",
+    "ETAG_BUCKET_SECONDS",
+]
@@ -0,0 +1,90 @@
+"""
+In-process async TTL cache with single-flight semantics.
+
+Built for the admin statistics/results hot path: the SSE generators and the
+REST statistics endpoints re-run the same heavy aggregate queries every few
+seconds for every connected client.  Wrapping those CRUD calls in a short-TTL
+cache collapses N concurrent callers into one database hit per interval.
+
+SINGLE-FLIGHT
+─────────────
+A per-key asyncio.Lock guarantees that when the cache is cold, exactly one
+caller executes the wrapped coroutine while concurrent callers wait and then
+read the freshly cached value.  Without this, 50 SSE clients ticking at the
+same instant would each fire the same aggregate query on a cache miss.
+
+MULTI-WORKER NOTE
+─────────────────
+Like the plaintext token cache in crud_voting_tokens.py, this cache is
+per-process.  Each worker computes its own copy at most once per TTL window,
+which already reduces DB load from O(clients) to O(workers).  Cross-worker
+sharing (e.g. Redis SETEX) can be layered in later without changing call sites.
+"""
+
+import asyncio
+from functools import wraps
+from typing import Dict
+from uuid import UUID
+
+from cachetools import TTLCache
+
+# Only these argument types participate in cache keys.  DB sessions (and
+# `self` on service methods) are deliberately excluded — they vary per request
+# but do not affect the computed result.
+_KEYABLE_TYPES = (str, int, float, bool, UUID)
+
+
+def _make_key(func, args, kwargs) -> str:
+    """Build a cache key from the function identity plus its keyable arguments."""
+    parts = [func.__module__, func.__qualname__]
+    parts += [str(a) for a in args if isinstance(a, _KEYABLE_TYPES)]
+    parts += [
+        f"{k}={v}" for k, v in sorted(kwargs.items())
+        if isinstance(v, _KEYABLE_TYPES)
+    ]
+    return "|".join(parts)
+
+
+def async_cached(ttl: float = 2.5, maxsize: int = 256):
+    """
+    Decorator: cache an async function's result for `ttl` seconds.
+
+    Usage:
+        @async_cached(ttl=settings.STATS_CACHE_TTL_SECONDS)
+        async def get_voting_statistics_engine(db, election_id): ...
+
+    The wrapped function gains a `cache_clear()` attribute for explicit
+    invalidation (e.g. after a write that must be visible immediately).
+    """
+    def decorator(func):
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Lock registry is bounded by key cardinality (one entry per
+        # election/endpoint combination), so it never grows meaningfully.
+        locks: Dict[str, asyncio.Lock] = {}
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(func, args, kwargs)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another waiter may have filled the cache while we blocked.
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+                result = await func(*args, **kwargs)
+                cache[key] = result
+                return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+__all__ = ["async_cached"]
@@ -0,0 +1,62 @@
+"""
+Verified-JWT payload cache.
+
+Every authenticated request re-ran HMAC signature verification and JSON
+parsing on a bearer token that is reused unchanged for the whole session
+(up to 8 hours for admins, 30 minutes for voters).  cached_decode_token
+memoizes the decoded payload of tokens that verified successfully, keyed
+by a SHA-256 of the raw token, and re-checks the exp claim on every hit
+so an expired token is never served from the cache.
+
+Tokens that fail verification are never cached — a forged or corrupted
+token pays full verification cost (and fails) on every attempt.
+"""
+
+import hashlib
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.utils.security import TokenManager
+
+_payload_cache: TTLCache = TTLCache(maxsize=4096, ttl=1800)
+
+
+def try_decode_token(token: str) -> Optional[dict]:
+    """
+    Cached decode that returns None on an invalid or expired token.
+
+    Preferred on request paths: malformed tokens (the common case under
+    abuse) cost a branch, not an exception unwind plus a re-raise chain.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+
+    payload = _payload_cache.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and time.time() >= exp:
+            _payload_cache.pop(key, None)
+            return None
+        return payload
+
+    payload = TokenManager.try_decode_token(token)
+    if payload is not None and payload.get("exp"):
+        _payload_cache[key] = payload
+    return payload
+
+
+def cached_decode_token(token: str) -> dict:
+    """
+    Drop-in replacement for TokenManager.decode_token on hot request paths.
+
+    Raises ValueError exactly like decode_token when the token is invalid
+    or expired.
+    """
+    payload = try_decode_token(token)
+    if payload is None:
+        raise ValueError("Invalid or expired token")
+    return payload
+
+
+__all__ = ["cached_decode_token", "try_decode_token"]
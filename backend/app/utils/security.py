@@ -7,11 +7,13 @@ from argon2 import PasswordHasher
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from typing import Optional
+import asyncio
 import os
-import hashlib
+import hmac
 import secrets
 from uuid import UUID
 
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -168,18 +170,22 @@ class TokenManager:
             raise ValueError("Invalid or expired token") from e
 
     @staticmethod
-    def hash_voting_token(token: str) -> str:
+    def try_decode_token(token: str) -> Optional[dict]:
         """
-        Hash voting token for storage
-        
-        Args:
-            token: Voting token to hash
-            
-        Returns:
-            SHA-256 hash of normalized token
+        Decode and verify JWT token, returning None on failure.
+
+        Non-raising variant of decode_token for request paths where an
+        invalid token is an expected outcome, not an error condition.
         """
-        clean_token = FriendlyTokenGenerator.normalize_token(token)
-        return hashlib.sha256(clean_token.encode()).hexdigest()
+        try:
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            return None
+
+    # NOTE: token hashing lives in crud_voting_tokens._hash_token (BLAKE2b)
+    # — the single implementation generation and lookup both use.  Do not
+    # add a hasher here; a second algorithm would silently produce hashes
+    # that never match the DB.
 
 
 def hash_password(password: str) -> str:
@@ -218,6 +224,34 @@ def verify_password(stored_hash: str, plain_password: str) -> bool:
         return False
 
 
+# Successful verifications only, keyed by HMAC(secret, password + hash) so
+# no plaintext (or anything reversible to it) ever sits in memory as a key.
+# Failures are never cached — a brute-forcer pays full Argon2 cost per guess.
+_verify_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+async def verify_password_cached(stored_hash: str, plain_password: str) -> bool:
+    """
+    verify_password with a short-TTL memo of successful verifications.
+
+    Argon2id at these parameters costs ~100 ms of CPU and 64 MiB per call,
+    which dominates login latency when a kiosk admin logs in repeatedly
+    during a session.  A cache hit skips the KDF entirely; a miss runs it
+    on a worker thread so the event loop stays free.
+    """
+    key = hmac.new(
+        SECRET_KEY.encode(),
+        plain_password.encode() + stored_hash.encode(),
+        "sha256",
+    ).digest()
+    if key in _verify_cache:
+        return True
+    ok = await asyncio.to_thread(verify_password, stored_hash, plain_password)
+    if ok:
+        _verify_cache[key] = True
+    return ok
+
+
 # Utility functions for backward compatibility
 def verify_pin(voting_pin: str, stored_hash: str) -> bool:
     """Verify voting PIN against stored hash"""
@@ -229,5 +263,6 @@ __all__ = [
     "TokenManager",
     "hash_password",
     "verify_password",
+    "verify_password_cached",
     "verify_pin",
 ]
\ No newline at end of file
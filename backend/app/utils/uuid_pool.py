@@ -0,0 +1,64 @@
+"""
+Pre-seeded UUID pool for bulk-insert hot paths.
+
+uuid.uuid4() calls os.urandom(16) — a syscall — for every ID.  When a bulk
+run needs thousands of IDs (e.g. token generation for a full voter roll),
+drawing one large random block up front and slicing it amortises the syscall
+cost across the whole pool while producing byte-for-byte valid RFC 4122
+version-4 UUIDs.
+
+Not a security downgrade: the bytes still come from os.urandom, just fetched
+in bulk.  Use plain uuid.uuid4() for one-off IDs; use fast_uuid4() in loops,
+or fast_uuid4_batch() when the loop runs on an executor thread and the count
+is known up front.
+"""
+
+import os
+import threading
+import uuid
+from typing import List
+
+# 4096 UUIDs per refill — one syscall per ~4k IDs instead of one per ID.
+_POOL_BYTES = 16 * 4096
+
+_buf = os.urandom(_POOL_BYTES)
+_idx = 0
+# Token generation runs _build_token_batch on executor threads, so the
+# slice-then-advance on the shared pool must be atomic — without the lock
+# two concurrent runs can draw the same 16 bytes and mint duplicate IDs.
+_lock = threading.Lock()
+
+
+def _stamp_v4(raw: bytearray) -> uuid.UUID:
+    """Stamp version (4) and variant (RFC 4122) bits onto 16 random bytes."""
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    return uuid.UUID(bytes=bytes(raw))
+
+
+def fast_uuid4() -> uuid.UUID:
+    """Return a random version-4 UUID drawn from the pre-seeded pool."""
+    global _buf, _idx
+    with _lock:
+        if _idx >= _POOL_BYTES:
+            _buf = os.urandom(_POOL_BYTES)
+            _idx = 0
+        raw = bytearray(_buf[_idx:_idx + 16])
+        _idx += 16
+    return _stamp_v4(raw)
+
+
+def fast_uuid4_batch(n: int) -> List[uuid.UUID]:
+    """Return n random version-4 UUIDs from one private os.urandom block.
+
+    The block is local to the call, so concurrent batches on executor
+    threads never contend (or share bytes) — same syscall amortisation as
+    the pool without touching shared state.
+    """
+    block = os.urandom(16 * n)
+    return [
+        _stamp_v4(bytearray(block[i:i + 16])) for i in range(0, 16 * n, 16)
+    ]
+
+
+__all__ = ["fast_uuid4", "fast_uuid4_batch"]
@@ -9,7 +9,7 @@ from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.core.config import Settings
+from app.core.config import settings
 from app.core.database import get_db
 from app.api.electorate_router import router as electorate_router
 from app.api.auth_router import router as auth_router
@@ -19,8 +19,7 @@ from app.api.admin_router import router as admin_router
 from app.api.results_router import router as results_router
 from app.api.candidate_routes import router as candidate_router
 from app.api.election_router import router as election_router
-
-settings = Settings()
+from app.middleware.auth_middleware import ClientIPMiddleware
 
 # Create FastAPI application
 app = FastAPI(
@@ -53,6 +52,9 @@ origins = [
     "https://*.vercel.app",
 ]
 
+# Resolve the client IP once per request for the rate-limit decorators
+app.add_middleware(ClientIPMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,